@@ -21,6 +21,17 @@ class Player:
     location: str = "Starting Village"
     quests: List[Dict[str, Any]] = field(default_factory=list)
     achievements: List[str] = field(default_factory=list)
+    _completed: int = field(default=0, init=False, repr=False)
+    
+    @property
+    def completed_count(self) -> int:
+        """Number of completed quests."""
+        return self._completed
+    
+    @property
+    def active_count(self) -> int:
+        """Number of quests still in progress."""
+        return len(self.quests) - self._completed
 
 @dataclass
 class GameWorld:
@@ -45,27 +56,29 @@ class GameState:
     
     def get_state_dict(self) -> Dict[str, Any]:
         """Get current game state as a dictionary."""
+        player, world = self.player, self.world
         return {
             "player": {
-                "name": self.player.name,
-                "level": self.player.level,
-                "health": self.player.health,
-                "max_health": self.player.max_health,
-                "experience": self.player.experience,
-                "gold": self.player.gold,
-                "inventory": self.player.inventory,
-                "equipment": self.player.equipment,
-                "location": self.player.location,
-                "quests": self.player.quests,
-                "achievements": self.player.achievements
+                "name": player.name,
+                "level": player.level,
+                "health": player.health,
+                "max_health": player.max_health,
+                "experience": player.experience,
+                "gold": player.gold,
+                "inventory": player.inventory,
+                "equipment": player.equipment,
+                "location": player.location,
+                "quests": player.quests,
+                "completed_quests": player.completed_count,
+                "achievements": player.achievements
             },
             "world": {
-                "current_location": self.world.current_location,
-                "discovered_locations": self.world.discovered_locations,
-                "world_state": self.world.world_state,
-                "time_of_day": self.world.time_of_day,
-                "weather": self.world.weather,
-                "events": self.world.events
+                "current_location": world.current_location,
+                "discovered_locations": world.discovered_locations,
+                "world_state": world.world_state,
+                "time_of_day": world.time_of_day,
+                "weather": world.weather,
+                "events": world.events
             },
             "game_mode": self.game_mode,
             "combat_state": self.combat_state,
@@ -168,6 +181,7 @@ class GameState:
             if quest.get("title") == quest_title and not quest.get("completed", False):
                 quest["completed"] = True
                 quest["completed_at"] = datetime.now().isoformat()
+                self.player._completed += 1
                 
                 # Give rewards
                 rewards = quest.get("rewards", {})
@@ -193,8 +207,11 @@ class GameState:
     def save_game(self):
         """Save the current game state to a file."""
         try:
-            with open(self.save_file, 'w') as f:
-                json.dump(self.get_state_dict(), f, indent=2)
+            # Encode in memory first so the file gets one write instead of
+            # one per token from json.dump
+            blob = json.dumps(self.get_state_dict(), indent=2).encode("utf-8")
+            with open(self.save_file, 'wb') as f:
+                f.write(blob)
             return "Game saved successfully!"
         except Exception as e:
             return f"Error saving game: {str(e)}"
@@ -217,6 +234,11 @@ class GameState:
             self.player.equipment = player_data.get("equipment", {})
             self.player.location = player_data.get("location", "Starting Village")
             self.player.quests = player_data.get("quests", [])
+            completed = player_data.get("completed_quests")
+            if completed is None:
+                # Older saves don't carry the counter; rebuild it once
+                completed = sum(1 for q in self.player.quests if q.get("completed", False))
+            self.player._completed = completed
             self.player.achievements = player_data.get("achievements", [])
             
             # Restore world data
@@ -248,6 +270,6 @@ class GameState:
 💰 Gold: {self.player.gold}
 📍 Location: {self.player.location}
 🎒 Inventory: {len(self.player.inventory)} items
-📜 Active Quests: {len([q for q in self.player.quests if not q.get('completed', False)])}
+📜 Active Quests: {self.player.active_count}
 🏆 Achievements: {len(self.player.achievements)}
         """.strip() 
\ No newline at end of file
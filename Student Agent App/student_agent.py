@@ -1,29 +1,42 @@
-import google.generativeai as genai
+import argparse
 import os
+import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+
+# Sent once as the model's system instruction instead of prefixed to every prompt
+_SYSTEM = "You are a helpful academic assistant."
+
+@lru_cache(maxsize=1)
+def _get_model():
+    # Imported, configured and created on first use, then shared by every helper below
+    import google.generativeai as genai
+    genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+    return genai.GenerativeModel('gemini-1.5-flash', system_instruction=_SYSTEM)
 
 def answer_academic_question(question):
-    model = genai.GenerativeModel('gemini-1.5-flash')
-    prompt = f"You are a helpful academic assistant. Answer this academic question: {question}"
+    model = _get_model()
+    prompt = f"Answer this academic question: {question}"
     response = model.generate_content(prompt)
     return response.text.strip()
 
+@lru_cache(maxsize=1)
 def provide_study_tips():
-    model = genai.GenerativeModel('gemini-1.5-flash')
-    prompt = "You are a helpful academic assistant. Give me 3 effective study tips for students."
+    # Takes no input, so one generated answer is reused for the rest of the session
+    model = _get_model()
+    prompt = "Give me 3 effective study tips for students."
     response = model.generate_content(prompt)
     return response.text.strip()
 
 def summarize_text(text):
-    model = genai.GenerativeModel('gemini-1.5-flash')
-    prompt = f"You are a helpful academic assistant. Summarize the following text:\n{text}"
+    model = _get_model()
+    prompt = f"Summarize the following text:\n{text}"
     response = model.generate_content(prompt)
     return response.text.strip()
 
-def main():
+def interactive():
     print("Welcome to the Smart Student Agent Assistant!")
     print("Options: 1) Academic Question 2) Study Tips 3) Summarize Text")
     choice = input("Choose an option (1/2/3): ")
@@ -38,5 +51,38 @@ def main():
     else:
         print("Invalid choice.")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Smart Student Agent Assistant. Run without a command for the interactive menu."
+    )
+    commands = parser.add_subparsers(dest="command")
+    ask = commands.add_parser("ask", help="answer an academic question")
+    ask.add_argument("question", nargs="?", help="the question to answer")
+    ask.add_argument("--stdin", action="store_true", help="answer one question per line of stdin")
+    commands.add_parser("tips", help="give 3 effective study tips")
+    summarize = commands.add_parser("summarize", help="summarize a piece of text")
+    summarize.add_argument("text", nargs="?", help="the text to summarize")
+    summarize.add_argument("--stdin", action="store_true", help="summarize each line of stdin")
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        interactive()
+    elif args.command == "tips":
+        print(provide_study_tips())
+    else:
+        handler = answer_academic_question if args.command == "ask" else summarize_text
+        value = args.question if args.command == "ask" else args.text
+        command_parser = ask if args.command == "ask" else summarize
+        if args.stdin:
+            # Keep one process (and one model) alive across many queries
+            for line in sys.stdin:
+                line = line.strip()
+                if line:
+                    print(handler(line), flush=True)
+        elif value:
+            print(handler(value))
+        else:
+            command_parser.error("an argument or --stdin is required")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
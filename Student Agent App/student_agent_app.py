@@ -1,39 +1,90 @@
 import streamlit as st
-import google.generativeai as genai
+import json
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 
+# Sent once as the model's system instruction instead of prefixed to every prompt
+_SYSTEM = "You are a helpful academic assistant."
+
+@st.cache_resource
+def get_model():
+    # One client per server process, shared across reruns and sessions; the SDK
+    # is only imported the first time a request needs it
+    import google.generativeai as genai
+    genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+    return genai.GenerativeModel('gemini-1.5-flash', system_instruction=_SYSTEM)
+
+@st.cache_data(ttl=3600)
 def get_gemini_response(prompt):
-    model = genai.GenerativeModel('gemini-1.5-flash')
+    model = get_model()
     response = model.generate_content(prompt)
     return response.text.strip()
 
+def stream_gemini_response(prompt):
+    # Yield text as Gemini generates it so the page can render before the reply is complete
+    model = get_model()
+    for chunk in model.generate_content(prompt, stream=True):
+        yield chunk.text
+
+def get_combined_response(question, text):
+    # One request covering every task; the reply is a JSON object keyed by task
+    tasks = {}
+    if question:
+        tasks["answer"] = f"answer this academic question: {question}"
+    tasks["tips"] = "give 3 effective study tips for students"
+    if text:
+        tasks["summary"] = f"summarize the following text:\n{text}"
+    prompt = (
+        "Complete every task below and reply with "
+        "only a JSON object that maps each task key to its result as a string.\n"
+        + "\n".join(f'"{key}": {task}' for key, task in tasks.items())
+    )
+    reply = get_gemini_response(prompt)
+    # The model sometimes wraps JSON in a markdown code fence
+    reply = reply.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    try:
+        result = json.loads(reply)
+    except ValueError:
+        result = None
+    # Anything but an object with every requested key is shown as one raw answer
+    if not isinstance(result, dict) or not all(key in result for key in tasks):
+        return {"answer": reply}
+    return result
+
 st.title("Student Agent Assistant")
 
 option = st.selectbox(
     "What would you like to do?",
-    ("Answer Academic Question", "Get Study Tips", "Summarize Text")
+    ("Answer Academic Question", "Get Study Tips", "Summarize Text", "All in One Request")
 )
 
 if option == "Answer Academic Question":
     question = st.text_input("Enter your academic question:")
     if st.button("Get Answer") and question:
-        prompt = f"You are a helpful academic assistant. Answer this academic question: {question}"
-        answer = get_gemini_response(prompt)
-        st.success(answer)
+        prompt = f"Answer this academic question: {question}"
+        st.write_stream(stream_gemini_response(prompt))
 
 elif option == "Get Study Tips":
     if st.button("Show Study Tips"):
-        prompt = "You are a helpful academic assistant. Give me 3 effective study tips for students."
-        tips = get_gemini_response(prompt)
-        st.info(tips)
+        prompt = "Give me 3 effective study tips for students."
+        st.write_stream(stream_gemini_response(prompt))
 
 elif option == "Summarize Text":
     text = st.text_area("Enter text to summarize:")
     if st.button("Summarize") and text:
-        prompt = f"You are a helpful academic assistant. Summarize the following text:\n{text}"
-        summary = get_gemini_response(prompt)
-        st.success(summary)
\ No newline at end of file
+        prompt = f"Summarize the following text:\n{text}"
+        st.write_stream(stream_gemini_response(prompt))
+
+elif option == "All in One Request":
+    question = st.text_input("Enter your academic question (optional):")
+    text = st.text_area("Enter text to summarize (optional):")
+    if st.button("Run All"):
+        results = get_combined_response(question, text)
+        if "answer" in results:
+            st.success(results["answer"])
+        if "tips" in results:
+            st.info(results["tips"])
+        if "summary" in results:
+            st.success(results["summary"])
\ No newline at end of file
@@ -1,33 +1,65 @@
-import google.generativeai as genai
 import asyncio
+import contextlib
+import hashlib
 import json
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, TYPE_CHECKING
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from datetime import datetime
 
 from config import Config
 from models import AgentResponse
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+# One Gemini client shared by every agent, created on first use by _get_client()
+_SHARED_GEMINI_CLIENT: Optional["genai.GenerativeModel"] = None
+_client_lock = asyncio.Lock()
+
+async def _get_client() -> Optional["genai.GenerativeModel"]:
+    """Return the shared Gemini client, or None when no API key is configured"""
+    global _SHARED_GEMINI_CLIENT
+    if _SHARED_GEMINI_CLIENT is None and Config.GEMINI_API_KEY:
+        async with _client_lock:
+            if _SHARED_GEMINI_CLIENT is None:
+                # Imported here so demo mode without an API key never loads the SDK
+                import google.generativeai as genai
+                genai.configure(api_key=Config.GEMINI_API_KEY)
+                _SHARED_GEMINI_CLIENT = genai.GenerativeModel(Config.GEMINI_MODEL)
+    return _SHARED_GEMINI_CLIENT
+
 class BaseAgent(ABC):
     """Base class for all travel agents with common functionality"""
     
+    # Gemini responses shared by all agents: prompt digest -> (stored_at, response)
+    # Kept in least-recently-used order and bounded by Config.LLM_CACHE_MAX_ENTRIES
+    _llm_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
-        self.model = None
         self.tools = []
         self.conversation_history = []
+        self._history_tokens = 0
+        self._last_compaction = None
+        # Recent (label, elapsed_ns) samples from _timed sections
+        self._timings = deque(maxlen=256)
+        # Static part of get_agent_info(); reset whenever a tool is added
+        self._agent_info_cache: Optional[Dict[str, Any]] = None
+        # Serialized tools for _build_prompt; reset whenever a tool is added
+        self._tools_json: Optional[str] = None
         
-        # Initialize Gemini API
-        if Config.GEMINI_API_KEY:
-            genai.configure(api_key=Config.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel(Config.GEMINI_MODEL)
-        else:
+        # The Gemini client itself is shared and created lazily by _get_client()
+        if not Config.GEMINI_API_KEY:
             print(f"Warning: {name} agent initialized without Gemini API key")
     
     def add_tool(self, tool: Dict[str, Any]):
         """Add a tool to the agent's toolkit"""
         self.tools.append(tool)
+        self._agent_info_cache = None
+        self._tools_json = None
     
     def add_to_history(self, role: str, content: str):
         """Add a message to the conversation history"""
@@ -36,30 +68,160 @@ class BaseAgent(ABC):
             "content": content,
             "timestamp": datetime.now().isoformat()
         })
+        self._history_tokens += self._estimate_tokens(content)
+        
+        if self._history_tokens > Config.HISTORY_TOKEN_LIMIT:
+            self._summarize_history()
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token count (about four characters per token)"""
+        return len(text) // 4 + 1
+    
+    def _summarize_history(self):
+        """Collapse all but the most recent turns into a single summary entry"""
+        now = time.monotonic()
+        # Circuit breaker: don't compact more than once per cooldown window
+        if (self._last_compaction is not None
+                and now - self._last_compaction < Config.HISTORY_COMPACTION_COOLDOWN_SECONDS):
+            return
+        
+        older = self.conversation_history[:-Config.HISTORY_KEEP_RECENT]
+        if len(older) < 2:
+            return
+        self._last_compaction = now
+        
+        recent = self.conversation_history[-Config.HISTORY_KEEP_RECENT:]
+        snippets = " | ".join(f"{msg['role']}: {msg['content'][:80].strip()}" for msg in older)
+        summary = {
+            "role": "system",
+            "content": f"Summary of {len(older)} earlier messages: {snippets}"[:1000],
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        self.conversation_history = [summary] + recent
+        self._history_tokens = sum(self._estimate_tokens(msg["content"]) for msg in self.conversation_history)
     
     async def call_gemini(self, prompt: str, context: Optional[str] = None) -> str:
         """Make a call to the Gemini API"""
-        if not self.model:
+        model = await _get_client()
+        if not model:
             return f"Mock response from {self.name}: {prompt}"
         
+        cache_key = self._cache_key(prompt, context)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            full_prompt = self._build_prompt(prompt, context)
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                full_prompt
-            )
-            return response.text
+            with self._timed("gemini"):
+                response = await asyncio.to_thread(model.generate_content, self._build_prompt(prompt, context))
+                response_text = response.text
+            self._store_cached_response(cache_key, response_text)
+            return response_text
         except Exception as e:
             print(f"Error calling Gemini API: {e}")
             return f"Error: Unable to process request - {str(e)}"
     
+    async def call_gemini_stream(self, prompt: str, context: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream a Gemini response chunk by chunk as it is generated"""
+        model = await _get_client()
+        if not model:
+            yield f"Mock response from {self.name}: {prompt}"
+            return
+        
+        cache_key = self._cache_key(prompt, context)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        try:
+            full_prompt = self._build_prompt(prompt, context)
+            start = time.perf_counter_ns()
+            response = await asyncio.to_thread(model.generate_content, full_prompt, stream=True)
+            chunks = iter(response)
+            parts = []
+            while True:
+                # Each next() may block on the network, so pull chunks off the event loop
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                if not parts:
+                    self._timings.append(("gemini_first_chunk", time.perf_counter_ns() - start))
+                parts.append(chunk.text)
+                yield chunk.text
+            self._store_cached_response(cache_key, "".join(parts))
+        except Exception as e:
+            print(f"Error calling Gemini API: {e}")
+            yield f"Error: Unable to process request - {str(e)}"
+    
+    @contextlib.contextmanager
+    def _timed(self, label: str):
+        """Record how long the enclosed block takes under the given label"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._timings.append((label, time.perf_counter_ns() - start))
+    
+    def get_timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Summarize recorded timings as count, p50 and p95 (milliseconds) per label"""
+        samples: Dict[str, List[int]] = {}
+        for label, elapsed in self._timings:
+            samples.setdefault(label, []).append(elapsed)
+        
+        stats = {}
+        for label, values in samples.items():
+            values.sort()
+            last = len(values) - 1
+            stats[label] = {
+                "count": len(values),
+                "p50_ms": values[round(last * 0.50)] / 1e6,
+                "p95_ms": values[round(last * 0.95)] / 1e6
+            }
+        return stats
+    
+    def _cache_key(self, prompt: str, context: Optional[str] = None) -> str:
+        """Digest of the agent, request prompt and context (history is not part of the key)"""
+        raw = f"{self.name}\0{prompt}\0{context or ''}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _get_cached_response(self, cache_key: str) -> Optional[str]:
+        """Return a cached Gemini response if it has not expired"""
+        entry = BaseAgent._llm_cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > Config.LLM_CACHE_TTL_SECONDS:
+            del BaseAgent._llm_cache[cache_key]
+            return None
+        BaseAgent._llm_cache.move_to_end(cache_key)
+        return response
+    
+    def _store_cached_response(self, cache_key: str, response: str):
+        """Cache a Gemini response, dropping expired and least recently used entries"""
+        cache = BaseAgent._llm_cache
+        now = time.monotonic()
+        # The oldest entries sit at the front, so expired ones are popped from there;
+        # any that a hit moved further back are dropped on lookup instead
+        while cache and now - next(iter(cache.values()))[0] > Config.LLM_CACHE_TTL_SECONDS:
+            cache.popitem(last=False)
+        cache[cache_key] = (now, response)
+        cache.move_to_end(cache_key)
+        while len(cache) > Config.LLM_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    
     def _build_prompt(self, prompt: str, context: Optional[str] = None) -> str:
         """Build a comprehensive prompt with context and tools"""
+        if self._tools_json is None:
+            self._tools_json = json.dumps(self.tools, indent=2) if self.tools else 'None'
+        
         system_prompt = f"""You are {self.name}, a specialized travel agent with the following description: {self.description}
 
 Your role is to help users with their travel needs by providing accurate, helpful, and personalized recommendations.
 
-Available tools: {json.dumps(self.tools, indent=2) if self.tools else 'None'}
+Available tools: {self._tools_json}
 
 Please respond in a helpful, professional manner. If you need to use tools, specify which tool and provide the necessary parameters.
 """
@@ -90,9 +252,14 @@ Please respond in a helpful, professional manner. If you need to use tools, spec
     
     def get_agent_info(self) -> Dict[str, Any]:
         """Get information about this agent"""
+        if self._agent_info_cache is None:
+            self._agent_info_cache = {
+                "name": self.name,
+                "description": self.description,
+                "tools": [tool.get("name", "Unknown") for tool in self.tools]
+            }
+        # History length changes on every request, so it is never cached
         return {
-            "name": self.name,
-            "description": self.description,
-            "tools": [tool.get("name", "Unknown") for tool in self.tools],
+            **self._agent_info_cache,
             "conversation_history_length": len(self.conversation_history)
         } 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import asyncio
+from bisect import bisect_left
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date, timedelta
 
@@ -9,6 +10,12 @@ from models import (
 )
 from mock_data import MockDataGenerator
 
+# Flight price ceilings per budget level; luxury is uncapped
+_FLIGHT_PRICE_CAPS = {
+    BudgetLevel.BUDGET: 500,
+    BudgetLevel.MODERATE: 1000
+}
+
 class BookingAgent(BaseAgent):
     """Agent specialized in booking flights and hotels"""
     
@@ -89,15 +96,15 @@ class BookingAgent(BaseAgent):
             Focus on providing practical, cost-effective options that match the user's budget and preferences.
             """
             
-            gemini_response = await self.call_gemini(booking_prompt)
+            # The Gemini call, flights and hotels are independent,
+            # so run them concurrently
+            gemini_response, flights, hotels = await asyncio.gather(
+                self.call_gemini(booking_prompt),
+                self._get_flight_options(travel_request, selected_destination),
+                self._get_hotel_options(travel_request, selected_destination)
+            )
             self.add_to_history("assistant", gemini_response)
             
-            # Generate flight options
-            flights = await self._get_flight_options(travel_request, selected_destination)
-            
-            # Generate hotel options
-            hotels = await self._get_hotel_options(travel_request, selected_destination)
-            
             # Calculate total costs
             total_cost = self._calculate_total_cost(flights, hotels, travel_request)
             
@@ -151,11 +158,11 @@ class BookingAgent(BaseAgent):
             num_options=5
         )
         
-        # Filter based on budget if needed
-        if travel_request.budget == BudgetLevel.BUDGET:
-            flights = [f for f in flights if f.price < 500]
-        elif travel_request.budget == BudgetLevel.MODERATE:
-            flights = [f for f in flights if f.price < 1000]
+        # Filter based on budget if needed; flights are sorted by price, so the
+        # affordable ones are a prefix found by binary search
+        price_cap = _FLIGHT_PRICE_CAPS.get(travel_request.budget)
+        if price_cap is not None:
+            flights = flights[:bisect_left(flights, price_cap, key=lambda f: f.price)]
         
         return flights[:3]  # Return top 3 options
     
@@ -171,13 +178,13 @@ class BookingAgent(BaseAgent):
         return hotels[:3]  # Return top 3 options
     
     def _calculate_total_cost(self, flights: List[Flight], hotels: List[Hotel], travel_request: TravelRequest) -> float:
-        """Calculate total cost for the trip"""
+        """Calculate total cost for the trip (flights and hotels are sorted by price)"""
         if not flights or not hotels:
             return 0.0
         
         # Use cheapest options for cost calculation
-        cheapest_flight = min(flights, key=lambda x: x.price)
-        cheapest_hotel = min(hotels, key=lambda x: x.price_per_night)
+        cheapest_flight = flights[0]
+        cheapest_hotel = hotels[0]
         
         flight_cost = cheapest_flight.price * travel_request.num_travelers
         
@@ -191,17 +198,15 @@ class BookingAgent(BaseAgent):
         return flight_cost + hotel_cost
     
     def _calculate_savings(self, flights: List[Flight], hotels: List[Hotel], travel_request: TravelRequest) -> Dict[str, float]:
-        """Calculate potential savings"""
+        """Calculate potential savings (flights and hotels are sorted by price)"""
         if len(flights) < 2 or len(hotels) < 2:
             return {"flight_savings": 0, "hotel_savings": 0, "total_savings": 0}
         
         # Flight savings
-        flight_prices = [f.price for f in flights]
-        flight_savings = max(flight_prices) - min(flight_prices)
+        flight_savings = flights[-1].price - flights[0].price
         
         # Hotel savings
-        hotel_prices = [h.price_per_night for h in hotels]
-        hotel_savings = (max(hotel_prices) - min(hotel_prices)) * 7  # 7 days
+        hotel_savings = (hotels[-1].price_per_night - hotels[0].price_per_night) * 7  # 7 days
         
         return {
             "flight_savings": flight_savings,
@@ -211,27 +216,27 @@ class BookingAgent(BaseAgent):
     
     def _format_flights(self, flights: List[Flight]) -> str:
         """Format flight options for display"""
-        formatted = ""
+        parts = []
         for i, flight in enumerate(flights, 1):
-            formatted += f"""
+            parts.append(f"""
 {i}. {flight.airline} {flight.flight_number}
    {flight.departure_airport} → {flight.arrival_airport}
    {flight.departure_time.strftime('%H:%M')} - {flight.arrival_time.strftime('%H:%M')} ({flight.duration})
    {flight.stops} stops | {flight.cabin_class} | ${flight.price}
-"""
-        return formatted
+""")
+        return "".join(parts)
     
     def _format_hotels(self, hotels: List[Hotel]) -> str:
         """Format hotel options for display"""
-        formatted = ""
+        parts = []
         for i, hotel in enumerate(hotels, 1):
-            formatted += f"""
+            parts.append(f"""
 {i}. {hotel.name}
    Rating: {hotel.rating}★ | ${hotel.price_per_night}/night
    Location: {hotel.location} ({hotel.distance_from_center})
    Amenities: {', '.join(hotel.amenities[:3])}
-"""
-        return formatted
+""")
+        return "".join(parts)
     
     async def book_travel(self, booking_data: Dict[str, Any]) -> AgentResponse:
         """Simulate booking the selected travel options"""
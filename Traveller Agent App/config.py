@@ -11,6 +11,16 @@ class Config:
     # Agent Configuration
     MAX_RETRIES: int = 3
     TIMEOUT_SECONDS: int = 30
+    LLM_CACHE_TTL_SECONDS: int = TIMEOUT_SECONDS * 10
+    LLM_CACHE_MAX_ENTRIES: int = 512
+    
+    # Conversation history compaction
+    HISTORY_TOKEN_LIMIT: int = 6000
+    HISTORY_KEEP_RECENT: int = 2
+    HISTORY_COMPACTION_COOLDOWN_SECONDS: int = 30
+    
+    # Planning sessions kept by the coordinator before the least recently used is dropped
+    MAX_TRACKED_SESSIONS: int = 1024
     
     # Mock Data Configuration
     MOCK_FLIGHTS_ENABLED: bool = True
@@ -6,16 +6,114 @@ Quick demonstration of the travel agent system with predefined examples
 
 import asyncio
 import json
+import sys
+import threading
 from datetime import date, timedelta
-from typing import Dict, Any
+from typing import Dict, Set, Tuple
 
 from config import Config
-from models import TravelRequest, TravelMood, BudgetLevel
+from models import TravelRequest, TravelMood, BudgetLevel, AgentResponse
 from travel_coordinator import TravelCoordinator
 from destination_agent import DestinationAgent
 from booking_agent import BookingAgent
 from explore_agent import ExploreAgent
 
+# Enum members and their menus are fixed, so build them once
+_MOOD_LIST = tuple(TravelMood)
+_BUDGET_LIST = tuple(BudgetLevel)
+_MOOD_MENU = "\n".join(f"{i}. {mood.value.title()}" for i, mood in enumerate(_MOOD_LIST, 1))
+_BUDGET_MENU = "\n".join(f"{i}. {budget.value.title()}" for i, budget in enumerate(_BUDGET_LIST, 1))
+
+# Demo examples; each request is only built when its example is picked
+_DEMO_EXAMPLES = [
+    {
+        "name": "Adventure Seeker",
+        "description": "Mountain climbing and outdoor activities",
+        "factory": lambda: TravelRequest(
+            user_name="Alex",
+            destination_preferences=["mountains", "hiking"],
+            mood=TravelMood.ADVENTURE,
+            budget=BudgetLevel.MODERATE,
+            start_date=date.today() + timedelta(days=30),
+            end_date=date.today() + timedelta(days=37),
+            num_travelers=2,
+            special_requirements=["outdoor activities", "scenic views"]
+        )
+    },
+    {
+        "name": "Culture Enthusiast",
+        "description": "Museums, historical sites, and local culture",
+        "factory": lambda: TravelRequest(
+            user_name="Maria",
+            destination_preferences=["museums", "history"],
+            mood=TravelMood.CULTURE,
+            budget=BudgetLevel.LUXURY,
+            start_date=date.today() + timedelta(days=45),
+            end_date=date.today() + timedelta(days=52),
+            num_travelers=1,
+            special_requirements=["guided tours", "cultural experiences"]
+        )
+    },
+    {
+        "name": "Beach Relaxation",
+        "description": "Tropical paradise and relaxation",
+        "factory": lambda: TravelRequest(
+            user_name="Sarah",
+            destination_preferences=["beach", "tropical"],
+            mood=TravelMood.RELAXATION,
+            budget=BudgetLevel.MODERATE,
+            start_date=date.today() + timedelta(days=60),
+            end_date=date.today() + timedelta(days=67),
+            num_travelers=3,
+            special_requirements=["spa", "ocean view"]
+        )
+    },
+    {
+        "name": "Food Explorer",
+        "description": "Culinary adventures and local cuisine",
+        "factory": lambda: TravelRequest(
+            user_name="Chef Mike",
+            destination_preferences=["food", "cuisine"],
+            mood=TravelMood.FOOD,
+            budget=BudgetLevel.MODERATE,
+            start_date=date.today() + timedelta(days=15),
+            end_date=date.today() + timedelta(days=22),
+            num_travelers=2,
+            special_requirements=["cooking classes", "local markets"]
+        )
+    }
+]
+
+_EXAMPLES_MENU = "Available Demo Examples:\n" + "\n".join(
+    f"{i}. {example['name']} - {example['description']}" for i, example in enumerate(_DEMO_EXAMPLES, 1)
+)
+
+async def _ainput(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the event loop.
+    
+    The read runs on a daemon thread rather than the default executor so a
+    prompt abandoned by Ctrl+C does not hold up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def read():
+        try:
+            outcome = (future.set_result, input(prompt))
+        except BaseException as e:
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(deliver, *outcome)
+        except RuntimeError:
+            pass  # Event loop already closed
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
 class TravelAgentDemo:
     """Demo class for showcasing the travel agent system"""
     
@@ -24,6 +122,23 @@ class TravelAgentDemo:
         self.destination_agent = DestinationAgent()
         self.booking_agent = BookingAgent()
         self.explore_agent = ExploreAgent()
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Successful DestinationAgent responses for the agent tests, keyed by request shape
+        self._sample_dest_cache: Dict[Tuple, AgentResponse] = {}
+    
+    def _spawn_background(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background while the user is at a prompt"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def _finish_background_tasks(self):
+        """Cancel and reap any background work still pending"""
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks.clear()
     
     async def run_demo(self):
         """Run the complete demo"""
@@ -35,87 +150,35 @@ class TravelAgentDemo:
             print("⚠️  Running in demo mode without Gemini API")
             print("Set GEMINI_API_KEY for full AI capabilities\n")
         
-        # Demo examples
-        examples = [
-            {
-                "name": "Adventure Seeker",
-                "description": "Mountain climbing and outdoor activities",
-                "request": TravelRequest(
-                    user_name="Alex",
-                    destination_preferences=["mountains", "hiking"],
-                    mood=TravelMood.ADVENTURE,
-                    budget=BudgetLevel.MODERATE,
-                    start_date=date.today() + timedelta(days=30),
-                    end_date=date.today() + timedelta(days=37),
-                    num_travelers=2,
-                    special_requirements=["outdoor activities", "scenic views"]
-                )
-            },
-            {
-                "name": "Culture Enthusiast",
-                "description": "Museums, historical sites, and local culture",
-                "request": TravelRequest(
-                    user_name="Maria",
-                    destination_preferences=["museums", "history"],
-                    mood=TravelMood.CULTURE,
-                    budget=BudgetLevel.LUXURY,
-                    start_date=date.today() + timedelta(days=45),
-                    end_date=date.today() + timedelta(days=52),
-                    num_travelers=1,
-                    special_requirements=["guided tours", "cultural experiences"]
-                )
-            },
-            {
-                "name": "Beach Relaxation",
-                "description": "Tropical paradise and relaxation",
-                "request": TravelRequest(
-                    user_name="Sarah",
-                    destination_preferences=["beach", "tropical"],
-                    mood=TravelMood.RELAXATION,
-                    budget=BudgetLevel.MODERATE,
-                    start_date=date.today() + timedelta(days=60),
-                    end_date=date.today() + timedelta(days=67),
-                    num_travelers=3,
-                    special_requirements=["spa", "ocean view"]
-                )
-            },
-            {
-                "name": "Food Explorer",
-                "description": "Culinary adventures and local cuisine",
-                "request": TravelRequest(
-                    user_name="Chef Mike",
-                    destination_preferences=["food", "cuisine"],
-                    mood=TravelMood.FOOD,
-                    budget=BudgetLevel.MODERATE,
-                    start_date=date.today() + timedelta(days=15),
-                    end_date=date.today() + timedelta(days=22),
-                    num_travelers=2,
-                    special_requirements=["cooking classes", "local markets"]
-                )
-            }
-        ]
-        
-        print("Available Demo Examples:")
-        for i, example in enumerate(examples, 1):
-            print(f"{i}. {example['name']} - {example['description']}")
+        print(_EXAMPLES_MENU)
         
         print("\n5. 🧪 Test Individual Agents")
         print("6. 🎯 Quick Custom Plan")
         print("7. 📊 System Overview")
         print("8. 🚪 Exit")
         
+        # Warm the Gemini response cache with the first example while the user decides
+        self._spawn_background(self.destination_agent.process_request(_DEMO_EXAMPLES[0]["factory"]()))
+        
+        try:
+            await self._menu_loop()
+        finally:
+            await self._finish_background_tasks()
+    
+    async def _menu_loop(self):
+        """Dispatch menu choices until the user exits"""
         while True:
             try:
-                choice = input("\nSelect demo option (1-8): ").strip()
+                choice = (await _ainput("\nSelect demo option (1-8): ")).strip()
                 
                 if choice == "1":
-                    await self._run_example_demo(examples[0])
+                    await self._run_example_demo(0)
                 elif choice == "2":
-                    await self._run_example_demo(examples[1])
+                    await self._run_example_demo(1)
                 elif choice == "3":
-                    await self._run_example_demo(examples[2])
+                    await self._run_example_demo(2)
                 elif choice == "4":
-                    await self._run_example_demo(examples[3])
+                    await self._run_example_demo(3)
                 elif choice == "5":
                     await self._test_individual_agents()
                 elif choice == "6":
@@ -134,13 +197,14 @@ class TravelAgentDemo:
             except Exception as e:
                 print(f"❌ Demo error: {str(e)}")
     
-    async def _run_example_demo(self, example: Dict[str, Any]):
+    async def _run_example_demo(self, index: int):
         """Run a specific example demo"""
+        example = _DEMO_EXAMPLES[index]
         print(f"\n🎯 Running Demo: {example['name']}")
         print(f"Description: {example['description']}")
         print("-" * 50)
         
-        request = example['request']
+        request = example['factory']()
         print(f"User: {request.user_name}")
         print(f"Mood: {request.mood.value}")
         print(f"Budget: {request.budget.value}")
@@ -152,24 +216,53 @@ class TravelAgentDemo:
         print("\n🚀 Creating complete travel plan...")
         print("(This demonstrates the full agent coordination workflow)")
         
-        # Run complete planning workflow
-        response = await self.coordinator.process_request(request)
+        # Run complete planning workflow, printing each section as soon as it is ready
+        response = None
+        streamed = False
+        async for item in self.coordinator.stream_progress(request):
+            if isinstance(item, AgentResponse):
+                response = item
+                continue
+            if not streamed:
+                print("\n" + "=" * 60)
+                print("✅ TRAVEL PLAN IN PROGRESS")
+                print("=" * 60)
+                streamed = True
+            sys.stdout.write(item)
+            sys.stdout.flush()
         
         if response.success:
             print("\n" + "=" * 60)
             print("✅ COMPLETE TRAVEL PLAN CREATED!")
             print("=" * 60)
-            print(response.message)
-            print("=" * 60)
             
             # Show session details
             session_id = response.data["session_id"]
             print(f"\n📊 Session ID: {session_id}")
             print(f"Total Cost: ${response.data['total_cost']:.2f}")
             print(f"Agents Used: {', '.join(response.data['agents_used'])}")
+            
+            # Prefetch the next example while the user reads the plan
+            self._spawn_background(self._prefetch_alternates(index))
         else:
             print(f"\n❌ Error: {response.message}")
     
+    async def _prefetch_alternates(self, index: int):
+        """Warm the response cache with the example that follows the given one"""
+        next_example = _DEMO_EXAMPLES[(index + 1) % len(_DEMO_EXAMPLES)]
+        await self.destination_agent.process_request(next_example["factory"]())
+    
+    async def _get_sample_destination(self, sample_request: TravelRequest) -> AgentResponse:
+        """Run the DestinationAgent for a sample request, reusing earlier results this session"""
+        key = (sample_request.mood, sample_request.budget, tuple(sample_request.destination_preferences),
+               tuple(sample_request.special_requirements), sample_request.num_travelers)
+        dest_response = self._sample_dest_cache.get(key)
+        if dest_response is None:
+            dest_response = await self.destination_agent.process_request(sample_request)
+            if dest_response.success:
+                self._sample_dest_cache[key] = dest_response
+        return dest_response
+    
     async def _test_individual_agents(self):
         """Test individual agents separately"""
         print("\n🧪 Individual Agent Testing")
@@ -179,7 +272,7 @@ class TravelAgentDemo:
         print("3. ExploreAgent Test")
         print("4. Back to main menu")
         
-        choice = input("Select agent to test (1-4): ").strip()
+        choice = (await _ainput("Select agent to test (1-4): ")).strip()
         
         # Create a sample request for testing
         sample_request = TravelRequest(
@@ -193,13 +286,13 @@ class TravelAgentDemo:
         try:
             if choice == "1":
                 print("\n🎯 Testing DestinationAgent...")
-                response = await self.destination_agent.process_request(sample_request)
+                response = await self._get_sample_destination(sample_request)
                 print(response.message)
                 
             elif choice == "2":
                 print("\n✈️ Testing BookingAgent...")
                 # First get a destination
-                dest_response = await self.destination_agent.process_request(sample_request)
+                dest_response = await self._get_sample_destination(sample_request)
                 if dest_response.success:
                     destination = dest_response.data["recommendations"][0]["destination"]
                     booking_request = {
@@ -214,7 +307,7 @@ class TravelAgentDemo:
             elif choice == "3":
                 print("\n🏛️ Testing ExploreAgent...")
                 # First get a destination
-                dest_response = await self.destination_agent.process_request(sample_request)
+                dest_response = await self._get_sample_destination(sample_request)
                 if dest_response.success:
                     destination = dest_response.data["recommendations"][0]["destination"]
                     explore_request = {
@@ -240,25 +333,23 @@ class TravelAgentDemo:
         print("-" * 30)
         
         # Get basic preferences
-        name = input("Your name (or press Enter for default): ").strip() or "Traveler"
+        name = (await _ainput("Your name (or press Enter for default): ")).strip() or "Traveler"
         
         print("\nTravel mood:")
-        for i, mood in enumerate(TravelMood, 1):
-            print(f"{i}. {mood.value.title()}")
-        mood_choice = input("Choose mood (1-8, or press Enter for default): ").strip()
+        print(_MOOD_MENU)
+        mood_choice = (await _ainput("Choose mood (1-8, or press Enter for default): ")).strip()
         
         try:
-            mood = list(TravelMood)[int(mood_choice) - 1] if mood_choice else TravelMood.ADVENTURE
+            mood = _MOOD_LIST[int(mood_choice) - 1] if mood_choice else TravelMood.ADVENTURE
         except (ValueError, IndexError):
             mood = TravelMood.ADVENTURE
         
         print("\nBudget level:")
-        for i, budget in enumerate(BudgetLevel, 1):
-            print(f"{i}. {budget.value.title()}")
-        budget_choice = input("Choose budget (1-3, or press Enter for default): ").strip()
+        print(_BUDGET_MENU)
+        budget_choice = (await _ainput("Choose budget (1-3, or press Enter for default): ")).strip()
         
         try:
-            budget = list(BudgetLevel)[int(budget_choice) - 1] if budget_choice else BudgetLevel.MODERATE
+            budget = _BUDGET_LIST[int(budget_choice) - 1] if budget_choice else BudgetLevel.MODERATE
         except (ValueError, IndexError):
             budget = BudgetLevel.MODERATE
         
@@ -299,14 +390,18 @@ class TravelAgentDemo:
         print(f"📊 Success Rate: {stats['success_rate']:.1f}%")
         
         print("\n🤖 Agent Details:")
-        for agent_name in stats['agents_available']:
-            if hasattr(self.coordinator, f"{agent_name.lower()}"):
-                agent = getattr(self.coordinator, f"{agent_name.lower()}")
-                agent_info = agent.get_agent_info()
-                print(f"  • {agent_info['name']}")
-                print(f"    Description: {agent_info['description']}")
-                print(f"    Tools: {len(agent_info['tools'])}")
-                print(f"    History: {agent_info['conversation_history_length']} messages")
+        for agent in self.coordinator.agents.values():
+            agent_info = agent.get_agent_info()
+            print(f"  • {agent_info['name']}")
+            print(f"    Description: {agent_info['description']}")
+            print(f"    Tools: {len(agent_info['tools'])}")
+            print(f"    History: {agent_info['conversation_history_length']} messages")
+        
+        print("\n⏱️  Timings (p50 / p95):")
+        for agent in (self.coordinator, *self.coordinator.agents.values()):
+            for label, timing in agent.get_timing_stats().items():
+                print(f"  • {agent.name}.{label}: {timing['p50_ms']:.2f}ms / "
+                      f"{timing['p95_ms']:.2f}ms ({timing['count']} samples)")
         
         print("\n🔧 Configuration:")
         print(f"  • Gemini Model: {Config.GEMINI_MODEL}")
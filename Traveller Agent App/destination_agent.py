@@ -1,11 +1,27 @@
 import asyncio
-from typing import List, Dict, Any
+import heapq
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
 from base_agent import BaseAgent
 from models import TravelRequest, Destination, TravelMood, BudgetLevel, AgentResponse
 from mock_data import MockDataGenerator
 
+# Budget levels ranked so a user can afford destinations at their level or lower
+_BUDGET_RANK = {
+    BudgetLevel.BUDGET: 1,
+    BudgetLevel.MODERATE: 2,
+    BudgetLevel.LUXURY: 3
+}
+
+# Daily per-person costs by budget level, with their totals precomputed
+_BASE_COSTS = {
+    BudgetLevel.BUDGET: {"accommodation": 50, "food": 30, "activities": 20},
+    BudgetLevel.MODERATE: {"accommodation": 150, "food": 60, "activities": 50},
+    BudgetLevel.LUXURY: {"accommodation": 400, "food": 120, "activities": 100}
+}
+_DAILY_TOTALS = {level: sum(costs.values()) for level, costs in _BASE_COSTS.items()}
+
 class DestinationAgent(BaseAgent):
     """Agent specialized in suggesting travel destinations based on user preferences"""
     
@@ -40,6 +56,12 @@ class DestinationAgent(BaseAgent):
         
         # Load available destinations
         self.available_destinations = MockDataGenerator.generate_destinations()
+        # Filter fields kept in lists parallel to available_destinations, so the
+        # mood and budget pass only touches these rather than every Destination
+        self._dest_budget_ranks = [_BUDGET_RANK[d.budget_range] for d in self.available_destinations]
+        self._dest_mood_masks = [d._mood_mask for d in self.available_destinations]
+        # Case-insensitive name index for direct lookups
+        self._dest_by_name = {d._name_lower: d for d in self.available_destinations}
     
     async def process_request(self, request: TravelRequest) -> AgentResponse:
         """Process a travel request and suggest destinations"""
@@ -64,32 +86,19 @@ class DestinationAgent(BaseAgent):
             Consider mood compatibility, budget suitability, and any special requirements.
             """
             
-            gemini_response = await self.call_gemini(analysis_prompt)
+            # The Gemini call and the local scoring are independent, so run the
+            # scoring in a worker thread while the call is in flight
+            gemini_response, (recommendations, formatted_recommendations) = await asyncio.gather(
+                self.call_gemini(analysis_prompt),
+                asyncio.to_thread(self._build_recommendations, request)
+            )
             self.add_to_history("assistant", gemini_response)
             
-            # Filter destinations based on criteria
-            suggested_destinations = self._filter_destinations(request)
-            
-            # Create detailed recommendations
-            recommendations = []
-            for dest in suggested_destinations[:5]:  # Top 5 recommendations
-                recommendation = {
-                    "destination": dest,
-                    "match_score": self._calculate_match_score(dest, request),
-                    "reasoning": self._generate_reasoning(dest, request),
-                    "best_time_to_visit": dest.best_time_to_visit,
-                    "estimated_cost": self._estimate_cost(dest, request)
-                }
-                recommendations.append(recommendation)
-            
-            # Sort by match score
-            recommendations.sort(key=lambda x: x["match_score"], reverse=True)
-            
             response_message = f"""
             Based on your preferences for {request.mood.value} travel with a {request.budget.value} budget, 
             I've found {len(recommendations)} perfect destinations for you:
             
-            {self._format_recommendations(recommendations)}
+            {formatted_recommendations}
             
             {gemini_response}
             """
@@ -111,42 +120,59 @@ class DestinationAgent(BaseAgent):
                 data=None
             )
     
-    def _filter_destinations(self, request: TravelRequest) -> List[Destination]:
-        """Filter destinations based on user preferences"""
-        filtered = []
+    def _build_recommendations(self, request: TravelRequest) -> Tuple[List[Dict[str, Any]], str]:
+        """Score the destinations and return the top 5 recommendations with their display text"""
+        with self._timed("scoring"):
+            # Filter destinations based on criteria
+            suggested_destinations = self._filter_destinations(request)
+            
+            # Create detailed recommendations for the 5 best matches, highest score first
+            top_destinations = heapq.nlargest(5, suggested_destinations, key=lambda item: item[1])
+            recommendations = []
+            for dest, match_score in top_destinations:
+                recommendation = {
+                    "destination": dest,
+                    "match_score": match_score,
+                    "reasoning": self._generate_reasoning(dest, request),
+                    "best_time_to_visit": dest.best_time_to_visit,
+                    "estimated_cost": self._estimate_cost(dest, request)
+                }
+                recommendations.append(recommendation)
         
-        for dest in self.available_destinations:
-            # Check mood compatibility
-            if request.mood in dest.mood_suitability:
-                # Check budget compatibility
-                if self._is_budget_compatible(dest.budget_range, request.budget):
-                    filtered.append(dest)
+        with self._timed("format"):
+            formatted_recommendations = self._format_recommendations(recommendations)
         
-        # If no exact matches, include some close matches
-        if not filtered:
-            for dest in self.available_destinations:
-                if self._calculate_match_score(dest, request) > 0.3:
-                    filtered.append(dest)
+        return recommendations, formatted_recommendations
+    
+    def _filter_destinations(self, request: TravelRequest) -> List[Tuple[Destination, float]]:
+        """Filter destinations based on user preferences, pairing each with its match score"""
+        user_rank = _BUDGET_RANK[request.budget]
+        mood_bit = request.mood.bit
+        destinations = self.available_destinations
+        
+        # Mood and budget checks run over the parallel lists; only matches get scored
+        matches = [
+            i for i, (mood_mask, dest_rank) in enumerate(zip(self._dest_mood_masks, self._dest_budget_ranks))
+            if mood_mask & mood_bit and dest_rank <= user_rank
+        ]
+        if matches:
+            return [(destinations[i], self._calculate_match_score(destinations[i], request)) for i in matches]
         
-        return filtered
+        # If no exact matches, include some close matches
+        scored = ((dest, self._calculate_match_score(dest, request)) for dest in destinations)
+        return [(dest, score) for dest, score in scored if score > 0.3]
     
     def _is_budget_compatible(self, dest_budget: BudgetLevel, user_budget: BudgetLevel) -> bool:
         """Check if destination budget is compatible with user budget"""
-        budget_hierarchy = {
-            BudgetLevel.BUDGET: 1,
-            BudgetLevel.MODERATE: 2,
-            BudgetLevel.LUXURY: 3
-        }
-        
         # User can afford destinations at their budget level or lower
-        return budget_hierarchy[dest_budget] <= budget_hierarchy[user_budget]
+        return _BUDGET_RANK[dest_budget] <= _BUDGET_RANK[user_budget]
     
     def _calculate_match_score(self, destination: Destination, request: TravelRequest) -> float:
         """Calculate how well a destination matches the user's preferences"""
         score = 0.0
         
         # Mood compatibility (40% weight)
-        if request.mood in destination.mood_suitability:
+        if destination._mood_mask & request.mood.bit:
             score += 0.4
         
         # Budget compatibility (30% weight)
@@ -155,13 +181,14 @@ class DestinationAgent(BaseAgent):
         
         # Preference matching (20% weight)
         for preference in request.destination_preferences:
-            if preference.lower() in destination.name.lower() or preference.lower() in destination.country.lower():
+            preference = preference.lower()
+            if preference in destination._name_lower or preference in destination._country_lower:
                 score += 0.1
         
         # Special requirements (10% weight)
-        for requirement in request.special_requirements:
-            if any(req.lower() in activity.lower() for activity in destination.activities for req in [requirement]):
-                score += 0.05
+        activities_blob = destination._activities_blob
+        score += 0.05 * sum(1 for requirement in request.special_requirements
+                            if requirement.lower() in activities_blob)
         
         return min(score, 1.0)
     
@@ -169,7 +196,7 @@ class DestinationAgent(BaseAgent):
         """Generate reasoning for why this destination is recommended"""
         reasons = []
         
-        if request.mood in destination.mood_suitability:
+        if destination._mood_mask & request.mood.bit:
             reasons.append(f"Perfect for {request.mood.value} travel")
         
         if self._is_budget_compatible(destination.budget_range, request.budget):
@@ -182,50 +209,43 @@ class DestinationAgent(BaseAgent):
     
     def _estimate_cost(self, destination: Destination, request: TravelRequest) -> Dict[str, float]:
         """Estimate travel costs for the destination"""
-        base_costs = {
-            BudgetLevel.BUDGET: {"accommodation": 50, "food": 30, "activities": 20},
-            BudgetLevel.MODERATE: {"accommodation": 150, "food": 60, "activities": 50},
-            BudgetLevel.LUXURY: {"accommodation": 400, "food": 120, "activities": 100}
-        }
-        
-        daily_costs = base_costs[destination.budget_range]
-        trip_duration = 7  # Default 7 days
+        daily_cost = _DAILY_TOTALS[destination.budget_range]
         
         if request.start_date and request.end_date:
             trip_duration = (request.end_date - request.start_date).days
-        
-        total_cost = sum(daily_costs.values()) * trip_duration * request.num_travelers
+        else:
+            trip_duration = 7  # Default 7 days
         
         return {
-            "daily_cost": sum(daily_costs.values()),
-            "total_cost": total_cost,
-            "cost_breakdown": daily_costs
+            "daily_cost": daily_cost,
+            "total_cost": daily_cost * trip_duration * request.num_travelers,
+            "cost_breakdown": dict(_BASE_COSTS[destination.budget_range])
         }
     
     def _format_recommendations(self, recommendations: List[Dict]) -> str:
         """Format recommendations for display"""
-        formatted = ""
+        parts = []
         for i, rec in enumerate(recommendations, 1):
             dest = rec["destination"]
-            formatted += f"""
+            parts.append(f"""
 {i}. {dest.name}, {dest.country}
    Match Score: {rec['match_score']:.1%}
    Reasoning: {rec['reasoning']}
    Best Time: {rec['best_time_to_visit']}
    Estimated Daily Cost: ${rec['estimated_cost']['daily_cost']}
    Description: {dest.description}
-"""
-        return formatted
+""")
+        return "".join(parts)
     
     async def get_destination_details(self, destination_name: str) -> AgentResponse:
         """Get detailed information about a specific destination"""
-        for dest in self.available_destinations:
-            if dest.name.lower() == destination_name.lower():
-                return self.create_response(
-                    success=True,
-                    message=f"Detailed information for {dest.name}",
-                    data={"destination": dest}
-                )
+        dest = self._dest_by_name.get(destination_name.lower())
+        if dest is not None:
+            return self.create_response(
+                success=True,
+                message=f"Detailed information for {dest.name}",
+                data={"destination": dest}
+            )
         
         return self.create_response(
             success=False,
@@ -5,10 +5,51 @@ from datetime import datetime
 from base_agent import BaseAgent
 from models import (
     TravelRequest, Destination, Attraction, Restaurant, TravelMood, 
-    AgentResponse
+    AgentResponse, DayPlan
 )
 from mock_data import MockDataGenerator
 
+# Padding for the morning, afternoon and evening slots of a day with fewer picks
+_EMPTY_SLOTS = (None, None, None)
+# Text shown for an empty slot when formatting the itinerary
+_FREE_ACTIVITY = "Free time"
+_RELAX = "Relax"
+_LOCAL_CHOICE = "Local choice"
+
+# General travel tips, shared by every destination
+_BASE_LOCAL_TIPS = (
+    "Learn a few basic phrases in the local language",
+    "Carry cash for small purchases and tips",
+    "Download offline maps before your trip",
+    "Check local customs and dress codes",
+    "Book popular attractions in advance",
+    "Try local transportation options"
+)
+
+_MOOD_EXTRA_TIPS = {
+    TravelMood.ADVENTURE: (
+        "Pack comfortable hiking shoes",
+        "Check weather conditions before outdoor activities",
+        "Consider hiring a local guide for adventure activities"
+    ),
+    TravelMood.CULTURE: (
+        "Research local customs and traditions",
+        "Visit museums during off-peak hours",
+        "Attend local cultural events if available"
+    ),
+    TravelMood.FOOD: (
+        "Try street food for authentic local flavors",
+        "Ask locals for restaurant recommendations",
+        "Consider taking a cooking class"
+    )
+}
+
+# Tips shown under every day of the itinerary
+_DAY_TIPS = (
+    "Start your day early to avoid crowds",
+    "Wear comfortable walking shoes"
+)
+
 class ExploreAgent(BaseAgent):
     """Agent specialized in suggesting attractions, restaurants, and activities"""
     
@@ -89,17 +130,18 @@ class ExploreAgent(BaseAgent):
             Focus on creating an authentic, memorable experience that matches the user's preferences.
             """
             
-            gemini_response = await self.call_gemini(exploration_prompt)
+            # The Gemini call, attractions and restaurants are independent,
+            # so run them concurrently
+            gemini_response, attractions, restaurants = await asyncio.gather(
+                self.call_gemini(exploration_prompt),
+                self._get_attractions(destination, travel_request),
+                self._get_restaurants(destination, travel_request)
+            )
             self.add_to_history("assistant", gemini_response)
             
-            # Generate attractions
-            attractions = await self._get_attractions(destination, travel_request)
-            
-            # Generate restaurants
-            restaurants = await self._get_restaurants(destination, travel_request)
-            
             # Create itinerary
-            itinerary = await self._create_itinerary(destination, attractions, restaurants, travel_request)
+            with self._timed("itinerary"):
+                itinerary = await self._create_itinerary(destination, attractions, restaurants, travel_request)
             
             # Create exploration summary
             exploration_summary = {
@@ -111,17 +153,22 @@ class ExploreAgent(BaseAgent):
                 "local_tips": self._generate_local_tips(destination, travel_request)
             }
             
+            with self._timed("format"):
+                formatted_attractions = self._format_attractions(attractions)
+                formatted_restaurants = self._format_restaurants(restaurants)
+                formatted_itinerary = self._format_itinerary(itinerary)
+            
             response_message = f"""
             I've discovered amazing things to explore in {destination.name}:
             
             ATTRACTIONS ({len(attractions)} recommendations):
-            {self._format_attractions(attractions)}
+            {formatted_attractions}
             
             RESTAURANTS ({len(restaurants)} recommendations):
-            {self._format_restaurants(restaurants)}
+            {formatted_restaurants}
             
             ITINERARY:
-            {self._format_itinerary(itinerary)}
+            {formatted_itinerary}
             
             {gemini_response}
             """
@@ -149,7 +196,7 @@ class ExploreAgent(BaseAgent):
         )
         
         # Sort by rating and relevance
-        attractions.sort(key=lambda x: x.rating, reverse=True)
+        attractions = sorted(attractions, key=lambda x: x.rating, reverse=True)
         
         return attractions[:6]  # Return top 6 attractions
     
@@ -162,12 +209,12 @@ class ExploreAgent(BaseAgent):
         )
         
         # Sort by rating
-        restaurants.sort(key=lambda x: x.rating, reverse=True)
+        restaurants = sorted(restaurants, key=lambda x: x.rating, reverse=True)
         
         return restaurants[:6]  # Return top 6 restaurants
     
     async def _create_itinerary(self, destination: Destination, attractions: List[Attraction], 
-                               restaurants: List[Restaurant], travel_request: TravelRequest) -> List[Dict]:
+                               restaurants: List[Restaurant], travel_request: TravelRequest) -> List[DayPlan]:
         """Create a day-by-day itinerary"""
         trip_duration = self._calculate_duration(travel_request)
         itinerary = []
@@ -176,33 +223,30 @@ class ExploreAgent(BaseAgent):
         attractions_per_day = max(1, len(attractions) // trip_duration)
         restaurants_per_day = max(1, len(restaurants) // trip_duration)
         
+        # Partition once up front instead of re-slicing on every day
+        attraction_chunks = [attractions[i:i + attractions_per_day]
+                             for i in range(0, len(attractions), attractions_per_day)]
+        restaurant_chunks = [restaurants[i:i + restaurants_per_day]
+                             for i in range(0, len(restaurants), restaurants_per_day)]
+        
         for day in range(1, trip_duration + 1):
-            day_attractions = attractions[(day-1)*attractions_per_day:day*attractions_per_day]
-            day_restaurants = restaurants[(day-1)*restaurants_per_day:day*restaurants_per_day]
-            
-            # Fill remaining slots if needed
-            if len(day_attractions) < attractions_per_day and len(attractions) > day*attractions_per_day:
-                day_attractions.extend(attractions[day*attractions_per_day:day*attractions_per_day + 1])
+            day_attractions = attraction_chunks[day - 1] if day <= len(attraction_chunks) else []
+            day_restaurants = restaurant_chunks[day - 1] if day <= len(restaurant_chunks) else []
             
-            if len(day_restaurants) < restaurants_per_day and len(restaurants) > day*restaurants_per_day:
-                day_restaurants.extend(restaurants[day*restaurants_per_day:day*restaurants_per_day + 1])
+            # Fill the three slots with the day's picks, then None
+            morning, afternoon, evening = (*day_attractions[:3], *_EMPTY_SLOTS[len(day_attractions):])
+            lunch, dinner, late = (*day_restaurants[:3], *_EMPTY_SLOTS[len(day_restaurants):])
             
-            day_plan = {
-                "day": day,
-                "morning": {
-                    "activity": day_attractions[0] if day_attractions else None,
-                    "restaurant": day_restaurants[0] if day_restaurants else None
-                },
-                "afternoon": {
-                    "activity": day_attractions[1] if len(day_attractions) > 1 else None,
-                    "restaurant": day_restaurants[1] if len(day_restaurants) > 1 else None
-                },
-                "evening": {
-                    "activity": day_attractions[2] if len(day_attractions) > 2 else None,
-                    "restaurant": day_restaurants[2] if len(day_restaurants) > 2 else None
-                },
-                "tips": self._generate_day_tips(day, destination, travel_request)
-            }
+            day_plan = DayPlan(
+                day=day,
+                morning_activity=morning,
+                morning_restaurant=lunch,
+                afternoon_activity=afternoon,
+                afternoon_restaurant=dinner,
+                evening_activity=evening,
+                evening_restaurant=late,
+                tips=self._generate_day_tips()
+            )
             
             itinerary.append(day_plan)
         
@@ -219,102 +263,60 @@ class ExploreAgent(BaseAgent):
         tips = [
             f"Best time to visit {destination.name} is {destination.best_time_to_visit}",
             f"Average temperature in {destination.name}: {destination.average_temperature}",
-            "Learn a few basic phrases in the local language",
-            "Carry cash for small purchases and tips",
-            "Download offline maps before your trip",
-            "Check local customs and dress codes",
-            "Book popular attractions in advance",
-            "Try local transportation options"
+            *_BASE_LOCAL_TIPS
         ]
         
         # Add mood-specific tips
-        if travel_request.mood == TravelMood.ADVENTURE:
-            tips.extend([
-                "Pack comfortable hiking shoes",
-                "Check weather conditions before outdoor activities",
-                "Consider hiring a local guide for adventure activities"
-            ])
-        elif travel_request.mood == TravelMood.CULTURE:
-            tips.extend([
-                "Research local customs and traditions",
-                "Visit museums during off-peak hours",
-                "Attend local cultural events if available"
-            ])
-        elif travel_request.mood == TravelMood.FOOD:
-            tips.extend([
-                "Try street food for authentic local flavors",
-                "Ask locals for restaurant recommendations",
-                "Consider taking a cooking class"
-            ])
+        tips.extend(_MOOD_EXTRA_TIPS.get(travel_request.mood, ()))
         
         return tips[:8]  # Return top 8 tips
     
-    def _generate_day_tips(self, day: int, destination: Destination, travel_request: TravelRequest) -> List[str]:
-        """Generate tips for a specific day"""
-        tips = [
-            "Start your day early to avoid crowds",
-            "Wear comfortable walking shoes",
-            "Carry water and snacks",
-            "Don't forget your camera"
-        ]
-        
-        if day == 1:
-            tips.extend([
-                "Take time to adjust to the local time zone",
-                "Visit a nearby landmark to get oriented",
-                "Try a local coffee shop to start your day"
-            ])
-        elif day == self._calculate_duration(travel_request):
-            tips.extend([
-                "Save some energy for your last day",
-                "Visit any must-see places you missed",
-                "Consider a relaxing evening activity"
-            ])
-        
-        return tips
+    def _generate_day_tips(self) -> List[str]:
+        """Generate the tips shown for a day of the itinerary"""
+        return list(_DAY_TIPS)
     
     def _format_attractions(self, attractions: List[Attraction]) -> str:
         """Format attractions for display"""
-        formatted = ""
+        parts = []
         for i, attraction in enumerate(attractions, 1):
-            formatted += f"""
+            parts.append(f"""
 {i}. {attraction.name} ({attraction.category})
    Rating: {attraction.rating}★ | {attraction.price_range}
    Location: {attraction.location}
    Hours: {attraction.opening_hours}
    Best Time: {attraction.best_time_to_visit}
    Description: {attraction.description}
-"""
-        return formatted
+""")
+        return "".join(parts)
     
     def _format_restaurants(self, restaurants: List[Restaurant]) -> str:
         """Format restaurants for display"""
-        formatted = ""
+        parts = []
         for i, restaurant in enumerate(restaurants, 1):
-            formatted += f"""
+            parts.append(f"""
 {i}. {restaurant.name} ({restaurant.cuisine})
    Rating: {restaurant.rating}★ | {restaurant.price_range}
    Location: {restaurant.location}
    Hours: {restaurant.opening_hours}
-   Specialties: {', '.join(restaurant.specialties[:3])}
+   Specialties: {restaurant._top_specialties}
    {f'Reservation Required' if restaurant.reservation_required else 'Walk-ins Welcome'}
-"""
-        return formatted
+""")
+        return "".join(parts)
     
-    def _format_itinerary(self, itinerary: List[Dict]) -> str:
+    def _format_itinerary(self, itinerary: List[DayPlan]) -> str:
         """Format itinerary for display"""
-        formatted = ""
+        parts = []
         for day_plan in itinerary:
-            formatted += f"""
-DAY {day_plan['day']}:
-   Morning: {day_plan['morning']['activity'].name if day_plan['morning']['activity'] else 'Free time'}
-   Lunch: {day_plan['morning']['restaurant'].name if day_plan['morning']['restaurant'] else 'Local choice'}
-   Afternoon: {day_plan['afternoon']['activity'].name if day_plan['afternoon']['activity'] else 'Free time'}
-   Dinner: {day_plan['afternoon']['restaurant'].name if day_plan['afternoon']['restaurant'] else 'Local choice'}
-   Evening: {day_plan['evening']['activity'].name if day_plan['evening']['activity'] else 'Relax'}
-   Tips: {', '.join(day_plan['tips'][:2])}
-"""
-        return formatted
+            parts.append(f"""
+DAY {day_plan.day}:
+   Morning: {getattr(day_plan.morning_activity, 'name', _FREE_ACTIVITY)}
+   Lunch: {getattr(day_plan.morning_restaurant, 'name', _LOCAL_CHOICE)}
+   Afternoon: {getattr(day_plan.afternoon_activity, 'name', _FREE_ACTIVITY)}
+   Dinner: {getattr(day_plan.afternoon_restaurant, 'name', _LOCAL_CHOICE)}
+   Evening: {getattr(day_plan.evening_activity, 'name', _RELAX)}
+   Tips: {', '.join(day_plan.tips)}
+""")
+        return "".join(parts)
     
     async def get_attraction_details(self, attraction_id: str) -> AgentResponse:
         """Get detailed information about a specific attraction"""
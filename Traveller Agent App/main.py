@@ -6,6 +6,7 @@ A comprehensive travel planning system using specialized AI agents with Gemini A
 
 import asyncio
 import json
+import sys
 from datetime import date, datetime
 from typing import Dict, Any
 
@@ -13,6 +14,22 @@ from config import Config
 from models import TravelRequest, TravelMood, BudgetLevel
 from travel_coordinator import TravelCoordinator
 
+# Menu order for the mood and budget prompts
+_TRAVEL_MOODS = tuple(TravelMood)
+_BUDGET_LEVELS = tuple(BudgetLevel)
+# Menu answer ("1", "2", ...) -> member
+_MOOD_BY_IDX = {str(i): mood for i, mood in enumerate(_TRAVEL_MOODS, 1)}
+_BUDGET_BY_IDX = {str(i): budget for i, budget in enumerate(_BUDGET_LEVELS, 1)}
+
+def _ask(prompt: str) -> str:
+    """Prompt on stdout and read one line from stdin (cheaper than input() for piped sessions)"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
 class TravelAgentApp:
     """Main application for the Travel Agent System"""
     
@@ -33,7 +50,7 @@ class TravelAgentApp:
         while True:
             try:
                 await self._show_main_menu()
-                choice = input("\nEnter your choice (1-6): ").strip()
+                choice = _ask("\nEnter your choice (1-6): ").strip()
                 
                 if choice == "1":
                     await self._create_travel_plan()
@@ -51,7 +68,7 @@ class TravelAgentApp:
                 else:
                     print("❌ Invalid choice. Please try again.")
                     
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n\n👋 Goodbye!")
                 break
             except Exception as e:
@@ -76,46 +93,44 @@ class TravelAgentApp:
         print("-" * 30)
         
         # Get user information
-        user_name = input("Enter your name: ").strip() or "Traveler"
+        user_name = _ask("Enter your name: ").strip() or "Traveler"
         
         # Get travel mood
         print("\nWhat's your travel mood?")
-        for i, mood in enumerate(TravelMood, 1):
+        for i, mood in enumerate(_TRAVEL_MOODS, 1):
             print(f"{i}. {mood.value.title()}")
         
-        mood_choice = input("Choose your mood (1-8): ").strip()
-        try:
-            mood = list(TravelMood)[int(mood_choice) - 1]
-        except (ValueError, IndexError):
+        mood_choice = _ask("Choose your mood (1-8): ").strip()
+        mood = _MOOD_BY_IDX.get(mood_choice)
+        if mood is None:
             mood = TravelMood.ADVENTURE
             print(f"Using default mood: {mood.value}")
         
         # Get budget
         print("\nWhat's your budget level?")
-        for i, budget in enumerate(BudgetLevel, 1):
+        for i, budget in enumerate(_BUDGET_LEVELS, 1):
             print(f"{i}. {budget.value.title()}")
         
-        budget_choice = input("Choose your budget (1-3): ").strip()
-        try:
-            budget = list(BudgetLevel)[int(budget_choice) - 1]
-        except (ValueError, IndexError):
+        budget_choice = _ask("Choose your budget (1-3): ").strip()
+        budget = _BUDGET_BY_IDX.get(budget_choice)
+        if budget is None:
             budget = BudgetLevel.MODERATE
             print(f"Using default budget: {budget.value}")
         
         # Get destination preferences
         print("\nAny specific destinations in mind? (comma-separated, or press Enter to skip)")
-        preferences_input = input("Destinations: ").strip()
+        preferences_input = _ask("Destinations: ").strip()
         destination_preferences = [p.strip() for p in preferences_input.split(",") if p.strip()]
         
         # Get special requirements
         print("\nAny special requirements? (comma-separated, or press Enter to skip)")
-        requirements_input = input("Requirements: ").strip()
+        requirements_input = _ask("Requirements: ").strip()
         special_requirements = [r.strip() for r in requirements_input.split(",") if r.strip()]
         
         # Get travel dates
         print("\nTravel dates (optional):")
-        start_date_str = input("Start date (YYYY-MM-DD, or press Enter to skip): ").strip()
-        end_date_str = input("End date (YYYY-MM-DD, or press Enter to skip): ").strip()
+        start_date_str = _ask("Start date (YYYY-MM-DD, or press Enter to skip): ").strip()
+        end_date_str = _ask("End date (YYYY-MM-DD, or press Enter to skip): ").strip()
         
         start_date = None
         end_date = None
@@ -127,8 +142,11 @@ class TravelAgentApp:
                 print("⚠️  Invalid date format. Using default dates.")
         
         # Get number of travelers
-        travelers_input = input("Number of travelers (default: 1): ").strip()
-        num_travelers = int(travelers_input) if travelers_input.isdigit() else 1
+        travelers_input = _ask("Number of travelers (default: 1): ").strip()
+        try:
+            num_travelers = max(1, int(travelers_input)) if travelers_input else 1
+        except ValueError:
+            num_travelers = 1
         
         # Create travel request
         travel_request = TravelRequest(
@@ -190,26 +208,25 @@ class TravelAgentApp:
         print("2. Change budget")
         print("3. Add special requirements")
         
-        choice = input("Enter your choice (1-3): ").strip()
+        choice = _ask("Enter your choice (1-3): ").strip()
         
         modifications = {}
         if choice == "1":
-            new_prefs = input("Enter new destination preferences (comma-separated): ").strip()
+            new_prefs = _ask("Enter new destination preferences (comma-separated): ").strip()
             if new_prefs:
                 modifications["destination"] = [p.strip() for p in new_prefs.split(",")]
         elif choice == "2":
             print("New budget level:")
-            for i, budget in enumerate(BudgetLevel, 1):
+            for i, budget in enumerate(_BUDGET_LEVELS, 1):
                 print(f"{i}. {budget.value.title()}")
-            budget_choice = input("Choose new budget (1-3): ").strip()
-            try:
-                new_budget = list(BudgetLevel)[int(budget_choice) - 1]
-                modifications["budget"] = new_budget
-            except (ValueError, IndexError):
+            budget_choice = _ask("Choose new budget (1-3): ").strip()
+            new_budget = _BUDGET_BY_IDX.get(budget_choice)
+            if new_budget is None:
                 print("❌ Invalid budget choice.")
                 return
+            modifications["budget"] = new_budget
         elif choice == "3":
-            new_reqs = input("Enter new special requirements (comma-separated): ").strip()
+            new_reqs = _ask("Enter new special requirements (comma-separated): ").strip()
             if new_reqs:
                 modifications["requirements"] = [r.strip() for r in new_reqs.split(",")]
         else:
@@ -237,11 +254,9 @@ class TravelAgentApp:
         
         # Show agent info
         print("\n🤖 Agent Information:")
-        for agent_name in stats['agents_available']:
-            if hasattr(self.coordinator, f"{agent_name.lower()}"):
-                agent = getattr(self.coordinator, f"{agent_name.lower()}")
-                agent_info = agent.get_agent_info()
-                print(f"  {agent_info['name']}: {agent_info['description']}")
+        for agent in self.coordinator.agents.values():
+            agent_info = agent.get_agent_info()
+            print(f"  {agent_info['name']}: {agent_info['description']}")
     
     async def _demo_agents(self):
         """Demo individual agents"""
@@ -251,7 +266,7 @@ class TravelAgentApp:
         print("2. BookingAgent Demo")
         print("3. ExploreAgent Demo")
         
-        choice = input("Choose agent to demo (1-3): ").strip()
+        choice = _ask("Choose agent to demo (1-3): ").strip()
         
         # Create a sample travel request
         sample_request = TravelRequest(
@@ -1,11 +1,94 @@
 import random
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from models import (
     Flight, Hotel, Attraction, Restaurant, Destination, 
     TravelMood, BudgetLevel
 )
 
+# Attraction categories to draw from for each travel mood
+_MOOD_ATTRACTIONS = {
+    TravelMood.ADVENTURE: ("Mountain", "Park", "Beach", "Historical Site"),
+    TravelMood.RELAXATION: ("Beach", "Garden", "Park", "Spa"),
+    TravelMood.CULTURE: ("Museum", "Historical Site", "Temple", "Castle"),
+    TravelMood.FOOD: ("Market", "Restaurant District", "Food Tour"),
+    TravelMood.NATURE: ("Park", "Garden", "Mountain", "Beach"),
+    TravelMood.URBAN: ("Shopping District", "Museum", "Market", "Historical Site"),
+    TravelMood.BEACH: ("Beach", "Water Sports", "Marina"),
+    TravelMood.MOUNTAINS: ("Mountain", "Park", "Hiking Trail")
+}
+
+# Attraction name templates per category; "{destination}" is filled in per call
+_ATTRACTION_NAMES = {
+    "Museum": ("{destination} National Museum", "Modern Art Gallery", "History Museum"),
+    "Historical Site": ("Ancient Ruins", "Historic District", "Old Town"),
+    "Park": ("Central Park", "Botanical Gardens", "City Park"),
+    "Beach": ("Golden Beach", "Crystal Bay", "Sunset Beach"),
+    "Mountain": ("Peak View", "Mountain Trail", "Summit Point"),
+    "Shopping District": ("Shopping Mall", "Market Street", "Boutique District"),
+    "Temple": ("Ancient Temple", "Peace Pagoda", "Meditation Center"),
+    "Castle": ("Royal Castle", "Fortress", "Palace"),
+    "Garden": ("Botanical Gardens", "Zen Garden", "Flower Park"),
+    "Market": ("Local Market", "Artisan Market", "Food Market")
+}
+
+# Static destination catalogue, materialized once at import
+_DESTINATIONS_DATA = (
+    {
+        "name": "Bali",
+        "country": "Indonesia",
+        "description": "Tropical paradise with beautiful beaches, temples, and culture",
+        "best_time_to_visit": "April to October",
+        "average_temperature": "26°C (79°F)",
+        "activities": ["Beach relaxation", "Temple visits", "Rice terrace tours", "Water sports"],
+        "mood_suitability": [TravelMood.RELAXATION, TravelMood.CULTURE, TravelMood.BEACH],
+        "budget_range": BudgetLevel.MODERATE
+    },
+    {
+        "name": "Tokyo",
+        "country": "Japan",
+        "description": "Modern metropolis blending technology with traditional culture",
+        "best_time_to_visit": "March to May and September to November",
+        "average_temperature": "15°C (59°F)",
+        "activities": ["Sightseeing", "Shopping", "Food tours", "Temple visits"],
+        "mood_suitability": [TravelMood.URBAN, TravelMood.CULTURE, TravelMood.FOOD],
+        "budget_range": BudgetLevel.MODERATE
+    },
+    {
+        "name": "Paris",
+        "country": "France",
+        "description": "City of love with iconic landmarks and world-class cuisine",
+        "best_time_to_visit": "April to June and September to October",
+        "average_temperature": "12°C (54°F)",
+        "activities": ["Museum visits", "Eiffel Tower", "Seine River cruise", "Shopping"],
+        "mood_suitability": [TravelMood.CULTURE, TravelMood.FOOD, TravelMood.URBAN],
+        "budget_range": BudgetLevel.MODERATE
+    },
+    {
+        "name": "New York",
+        "country": "USA",
+        "description": "The city that never sleeps with endless entertainment options",
+        "best_time_to_visit": "April to June and September to November",
+        "average_temperature": "13°C (55°F)",
+        "activities": ["Broadway shows", "Museum visits", "Central Park", "Shopping"],
+        "mood_suitability": [TravelMood.URBAN, TravelMood.CULTURE, TravelMood.FOOD],
+        "budget_range": BudgetLevel.MODERATE
+    },
+    {
+        "name": "Swiss Alps",
+        "country": "Switzerland",
+        "description": "Breathtaking mountain scenery perfect for adventure and relaxation",
+        "best_time_to_visit": "December to March (skiing) or June to September (hiking)",
+        "average_temperature": "5°C (41°F)",
+        "activities": ["Skiing", "Hiking", "Mountain biking", "Scenic train rides"],
+        "mood_suitability": [TravelMood.ADVENTURE, TravelMood.MOUNTAINS, TravelMood.NATURE],
+        "budget_range": BudgetLevel.LUXURY
+    }
+)
+
+_DESTINATIONS = tuple(Destination(**data) for data in _DESTINATIONS_DATA)
+
 class MockDataGenerator:
     """Generates realistic mock data for the travel system"""
     
@@ -42,39 +125,77 @@ class MockDataGenerator:
         "Museum", "Historical Site", "Park", "Beach", "Mountain",
         "Shopping District", "Temple", "Castle", "Garden", "Market"
     ]
+    
+    HOTEL_PRICE_RANGES = {
+        BudgetLevel.BUDGET: (50, 150),
+        BudgetLevel.MODERATE: (150, 400),
+        BudgetLevel.LUXURY: (400, 1000)
+    }
+    
+    # Amenities every hotel in a budget tier has
+    HOTEL_AMENITIES = {
+        BudgetLevel.BUDGET: ("WiFi", "Air Conditioning"),
+        BudgetLevel.MODERATE: ("WiFi", "Air Conditioning", "Pool", "Restaurant", "Gym"),
+        BudgetLevel.LUXURY: ("WiFi", "Air Conditioning", "Spa", "Concierge", "Room Service",
+                             "Pool", "Restaurant", "Gym", "Business Center")
+    }
+    
+    # Pools that each generated item draws a random subset from
+    HOTEL_EXTRAS = ("Parking", "Shuttle", "Bar", "Laundry")
+    ROOM_TYPES = ("Standard", "Deluxe", "Suite", "Executive")
+    ATTRACTION_TIPS = (
+        "Visit early to avoid crowds",
+        "Bring comfortable shoes",
+        "Don't forget your camera",
+        "Check the weather forecast",
+        "Book tickets in advance"
+    )
+    RESTAURANT_SPECIALTIES = (
+        "Signature Pasta", "Fresh Seafood", "Local Specialties",
+        "Chef's Special", "Seasonal Menu", "Traditional Dishes"
+    )
 
     @staticmethod
     def generate_flights(origin: str, destination: str, date: date, num_options: int = 5) -> List[Flight]:
         """Generate mock flight options"""
         flights = []
+        departure_airport = MockDataGenerator.AIRPORTS.get(origin, "JFK")
+        arrival_airport = MockDataGenerator.AIRPORTS.get(destination, "LHR")
+        
+        # Draw each field for every option up front, then assemble the flights
+        departure_hours = random.choices(range(6, 23), k=num_options)  # 6 AM to 10 PM
+        departure_minutes = random.choices((0, 15, 30, 45), k=num_options)
+        durations = random.choices(range(2, 13), k=num_options)  # 2-12 hours
+        price_variations = [random.uniform(0.8, 1.5) for _ in range(num_options)]
+        flight_numbers = random.choices(range(100, 1000), k=num_options)
+        extra_minutes = random.choices(range(60), k=num_options)
+        seats = random.choices(range(5, 51), k=num_options)
+        airlines = random.choices(MockDataGenerator.AIRLINES, k=num_options)
+        prefixes = random.choices(("EK", "QR", "SQ", "NH", "LH"), k=num_options)
+        stops = random.choices((0, 1, 2), k=num_options)
+        cabins = random.choices(("Economy", "Premium Economy", "Business", "First"), k=num_options)
+        midnight = datetime(date.year, date.month, date.day)
         
         for i in range(num_options):
-            # Random departure time between 6 AM and 10 PM
-            departure_hour = random.randint(6, 22)
-            departure_minute = random.choice([0, 15, 30, 45])
-            departure_time = datetime.combine(date, datetime.min.time().replace(hour=departure_hour, minute=departure_minute))
-            
-            # Flight duration between 2-12 hours
-            duration_hours = random.randint(2, 12)
+            duration_hours = durations[i]
+            departure_time = midnight + timedelta(hours=departure_hours[i], minutes=departure_minutes[i])
             arrival_time = departure_time + timedelta(hours=duration_hours)
             
             # Price based on duration and airline
-            base_price = 200 + (duration_hours * 50)
-            price_variation = random.uniform(0.8, 1.5)
-            price = round(base_price * price_variation, 2)
+            price = round((200 + duration_hours * 50) * price_variations[i], 2)
             
             flight = Flight(
-                airline=random.choice(MockDataGenerator.AIRLINES),
-                flight_number=f"{random.choice(['EK', 'QR', 'SQ', 'NH', 'LH'])}{random.randint(100, 999)}",
-                departure_airport=MockDataGenerator.AIRPORTS.get(origin, "JFK"),
-                arrival_airport=MockDataGenerator.AIRPORTS.get(destination, "LHR"),
+                airline=airlines[i],
+                flight_number=f"{prefixes[i]}{flight_numbers[i]}",
+                departure_airport=departure_airport,
+                arrival_airport=arrival_airport,
                 departure_time=departure_time,
                 arrival_time=arrival_time,
                 price=price,
-                duration=f"{duration_hours}h {random.randint(0, 59)}m",
-                stops=random.choice([0, 1, 2]),
-                cabin_class=random.choice(["Economy", "Premium Economy", "Business", "First"]),
-                available_seats=random.randint(5, 50)
+                duration=f"{duration_hours}h {extra_minutes[i]}m",
+                stops=stops[i],
+                cabin_class=cabins[i],
+                available_seats=seats[i]
             )
             flights.append(flight)
         
@@ -85,74 +206,50 @@ class MockDataGenerator:
         """Generate mock hotel options"""
         hotels = []
         
-        price_ranges = {
-            BudgetLevel.BUDGET: (50, 150),
-            BudgetLevel.MODERATE: (150, 400),
-            BudgetLevel.LUXURY: (400, 1000)
-        }
+        min_price, max_price = MockDataGenerator.HOTEL_PRICE_RANGES[budget]
+        # Amenities based on budget
+        base_amenities = list(MockDataGenerator.HOTEL_AMENITIES[budget])
         
-        min_price, max_price = price_ranges[budget]
+        prices = [round(random.uniform(min_price, max_price), 2) for _ in range(num_options)]
+        ratings = [round(random.uniform(3.0, 5.0), 1) for _ in range(num_options)]
+        distances = random.choices(range(1, 11), k=num_options)
+        chains = random.choices(MockDataGenerator.HOTEL_CHAINS, k=num_options)
+        extra_counts = random.choices(range(0, 3), k=num_options)
+        room_type_counts = random.choices(range(2, 5), k=num_options)
         
         for i in range(num_options):
-            price = round(random.uniform(min_price, max_price), 2)
-            rating = round(random.uniform(3.0, 5.0), 1)
-            
-            # Amenities based on budget
-            base_amenities = ["WiFi", "Air Conditioning"]
-            if budget == BudgetLevel.MODERATE:
-                base_amenities.extend(["Pool", "Restaurant", "Gym"])
-            elif budget == BudgetLevel.LUXURY:
-                base_amenities.extend(["Spa", "Concierge", "Room Service", "Pool", "Restaurant", "Gym", "Business Center"])
-            
             hotel = Hotel(
-                name=f"{random.choice(MockDataGenerator.HOTEL_CHAINS)} {destination}",
+                name=f"{chains[i]} {destination}",
                 location=f"Downtown {destination}",
-                rating=rating,
-                price_per_night=price,
-                amenities=base_amenities + random.sample(["Parking", "Shuttle", "Bar", "Laundry"], random.randint(0, 2)),
-                room_types=random.sample(["Standard", "Deluxe", "Suite", "Executive"], random.randint(2, 4)),
+                rating=ratings[i],
+                price_per_night=prices[i],
+                amenities=base_amenities + random.sample(MockDataGenerator.HOTEL_EXTRAS, extra_counts[i]),
+                room_types=random.sample(MockDataGenerator.ROOM_TYPES, room_type_counts[i]),
                 description=f"Comfortable accommodation in the heart of {destination} with excellent amenities and service.",
-                distance_from_center=f"{random.randint(1, 10)} km"
+                distance_from_center=f"{distances[i]} km"
             )
             hotels.append(hotel)
         
         return sorted(hotels, key=lambda x: x.price_per_night)
 
     @staticmethod
-    def generate_attractions(destination: str, mood: TravelMood, num_options: int = 8) -> List[Attraction]:
-        """Generate mock attractions based on destination and mood"""
+    @lru_cache(maxsize=128)
+    def generate_attractions(destination: str, mood: TravelMood, num_options: int = 8) -> Tuple[Attraction, ...]:
+        """Generate mock attractions based on destination and mood (cached per arguments)"""
         attractions = []
         
-        # Attraction types based on mood
-        mood_attractions = {
-            TravelMood.ADVENTURE: ["Mountain", "Park", "Beach", "Historical Site"],
-            TravelMood.RELAXATION: ["Beach", "Garden", "Park", "Spa"],
-            TravelMood.CULTURE: ["Museum", "Historical Site", "Temple", "Castle"],
-            TravelMood.FOOD: ["Market", "Restaurant District", "Food Tour"],
-            TravelMood.NATURE: ["Park", "Garden", "Mountain", "Beach"],
-            TravelMood.URBAN: ["Shopping District", "Museum", "Market", "Historical Site"],
-            TravelMood.BEACH: ["Beach", "Water Sports", "Marina"],
-            TravelMood.MOUNTAINS: ["Mountain", "Park", "Hiking Trail"]
-        }
-        
-        categories = mood_attractions.get(mood, MockDataGenerator.ATTRACTION_CATEGORIES)
-        
-        attraction_names = {
-            "Museum": [f"{destination} National Museum", f"Modern Art Gallery", f"History Museum"],
-            "Historical Site": [f"Ancient Ruins", f"Historic District", f"Old Town"],
-            "Park": [f"Central Park", f"Botanical Gardens", f"City Park"],
-            "Beach": [f"Golden Beach", f"Crystal Bay", f"Sunset Beach"],
-            "Mountain": [f"Peak View", f"Mountain Trail", f"Summit Point"],
-            "Shopping District": [f"Shopping Mall", f"Market Street", f"Boutique District"],
-            "Temple": [f"Ancient Temple", f"Peace Pagoda", f"Meditation Center"],
-            "Castle": [f"Royal Castle", f"Fortress", f"Palace"],
-            "Garden": [f"Botanical Gardens", f"Zen Garden", f"Flower Park"],
-            "Market": [f"Local Market", f"Artisan Market", f"Food Market"]
-        }
+        categories = _MOOD_ATTRACTIONS.get(mood, MockDataGenerator.ATTRACTION_CATEGORIES)
+        drawn_categories = random.choices(categories, k=num_options)
+        price_ranges = random.choices(("Free", "$", "$$", "$$$"), k=num_options)
+        opening_hours = random.choices(range(8, 11), k=num_options)
+        closing_hours = random.choices(range(6, 11), k=num_options)
+        best_times = random.choices(("Morning", "Afternoon", "Evening", "All day"), k=num_options)
+        tip_counts = random.choices(range(2, 5), k=num_options)
         
         for i in range(num_options):
-            category = random.choice(categories)
-            name = random.choice(attraction_names.get(category, [f"{category} in {destination}"]))
+            category = drawn_categories[i]
+            names = _ATTRACTION_NAMES.get(category)
+            name = random.choice(names).format(destination=destination) if names else f"{category} in {destination}"
             
             attraction = Attraction(
                 name=name,
@@ -160,24 +257,19 @@ class MockDataGenerator:
                 description=f"Experience the best of {destination} at this amazing {category.lower()}.",
                 location=f"{destination} City Center",
                 rating=round(random.uniform(3.5, 5.0), 1),
-                price_range=random.choice(["Free", "$", "$$", "$$$"]),
-                opening_hours=f"{random.randint(8, 10)}:00 AM - {random.randint(6, 10)}:00 PM",
-                best_time_to_visit=random.choice(["Morning", "Afternoon", "Evening", "All day"]),
-                tips=random.sample([
-                    "Visit early to avoid crowds",
-                    "Bring comfortable shoes",
-                    "Don't forget your camera",
-                    "Check the weather forecast",
-                    "Book tickets in advance"
-                ], random.randint(2, 4))
+                price_range=price_ranges[i],
+                opening_hours=f"{opening_hours[i]}:00 AM - {closing_hours[i]}:00 PM",
+                best_time_to_visit=best_times[i],
+                tips=random.sample(MockDataGenerator.ATTRACTION_TIPS, tip_counts[i])
             )
             attractions.append(attraction)
         
-        return attractions
+        return tuple(attractions)
 
     @staticmethod
-    def generate_restaurants(destination: str, num_options: int = 6) -> List[Restaurant]:
-        """Generate mock restaurant options"""
+    @lru_cache(maxsize=128)
+    def generate_restaurants(destination: str, num_options: int = 6) -> Tuple[Restaurant, ...]:
+        """Generate mock restaurant options (cached per arguments)"""
         restaurants = []
         
         restaurant_names = [
@@ -186,87 +278,34 @@ class MockDataGenerator:
             f"Royal Kitchen", f"Sunset Cafe", f"Urban Eats"
         ]
         
+        cuisines = random.choices(MockDataGenerator.CUISINES, k=num_options)
+        names = random.choices(restaurant_names, k=num_options)
+        price_ranges = random.choices(("$", "$$", "$$$", "$$$$"), k=num_options)
+        opening_hours = random.choices(range(7, 12), k=num_options)
+        closing_hours = random.choices(range(9, 12), k=num_options)
+        # One random bit per restaurant decides whether it takes reservations
+        reservation_bits = random.getrandbits(num_options) if num_options > 0 else 0
+        specialty_counts = random.choices(range(2, 5), k=num_options)
+        
         for i in range(num_options):
-            cuisine = random.choice(MockDataGenerator.CUISINES)
-            name = random.choice(restaurant_names)
+            cuisine = cuisines[i]
             
             restaurant = Restaurant(
-                name=name,
+                name=names[i],
                 cuisine=cuisine,
                 rating=round(random.uniform(3.5, 5.0), 1),
-                price_range=random.choice(["$", "$$", "$$$", "$$$$"]),
+                price_range=price_ranges[i],
                 location=f"{destination} Downtown",
                 description=f"Authentic {cuisine.lower()} cuisine in a beautiful setting.",
-                specialties=random.sample([
-                    "Signature Pasta", "Fresh Seafood", "Local Specialties",
-                    "Chef's Special", "Seasonal Menu", "Traditional Dishes"
-                ], random.randint(2, 4)),
-                opening_hours=f"{random.randint(7, 11)}:00 AM - {random.randint(9, 11)}:00 PM",
-                reservation_required=random.choice([True, False])
+                specialties=random.sample(MockDataGenerator.RESTAURANT_SPECIALTIES, specialty_counts[i]),
+                opening_hours=f"{opening_hours[i]}:00 AM - {closing_hours[i]}:00 PM",
+                reservation_required=bool(reservation_bits >> i & 1)
             )
             restaurants.append(restaurant)
         
-        return restaurants
+        return tuple(restaurants)
 
     @staticmethod
-    def generate_destinations() -> List[Destination]:
-        """Generate mock destination data"""
-        destinations_data = [
-            {
-                "name": "Bali",
-                "country": "Indonesia",
-                "description": "Tropical paradise with beautiful beaches, temples, and culture",
-                "best_time_to_visit": "April to October",
-                "average_temperature": "26°C (79°F)",
-                "activities": ["Beach relaxation", "Temple visits", "Rice terrace tours", "Water sports"],
-                "mood_suitability": [TravelMood.RELAXATION, TravelMood.CULTURE, TravelMood.BEACH],
-                "budget_range": BudgetLevel.MODERATE
-            },
-            {
-                "name": "Tokyo",
-                "country": "Japan",
-                "description": "Modern metropolis blending technology with traditional culture",
-                "best_time_to_visit": "March to May and September to November",
-                "average_temperature": "15°C (59°F)",
-                "activities": ["Sightseeing", "Shopping", "Food tours", "Temple visits"],
-                "mood_suitability": [TravelMood.URBAN, TravelMood.CULTURE, TravelMood.FOOD],
-                "budget_range": BudgetLevel.MODERATE
-            },
-            {
-                "name": "Paris",
-                "country": "France",
-                "description": "City of love with iconic landmarks and world-class cuisine",
-                "best_time_to_visit": "April to June and September to October",
-                "average_temperature": "12°C (54°F)",
-                "activities": ["Museum visits", "Eiffel Tower", "Seine River cruise", "Shopping"],
-                "mood_suitability": [TravelMood.CULTURE, TravelMood.FOOD, TravelMood.URBAN],
-                "budget_range": BudgetLevel.MODERATE
-            },
-            {
-                "name": "New York",
-                "country": "USA",
-                "description": "The city that never sleeps with endless entertainment options",
-                "best_time_to_visit": "April to June and September to November",
-                "average_temperature": "13°C (55°F)",
-                "activities": ["Broadway shows", "Museum visits", "Central Park", "Shopping"],
-                "mood_suitability": [TravelMood.URBAN, TravelMood.CULTURE, TravelMood.FOOD],
-                "budget_range": BudgetLevel.MODERATE
-            },
-            {
-                "name": "Swiss Alps",
-                "country": "Switzerland",
-                "description": "Breathtaking mountain scenery perfect for adventure and relaxation",
-                "best_time_to_visit": "December to March (skiing) or June to September (hiking)",
-                "average_temperature": "5°C (41°F)",
-                "activities": ["Skiing", "Hiking", "Mountain biking", "Scenic train rides"],
-                "mood_suitability": [TravelMood.ADVENTURE, TravelMood.MOUNTAINS, TravelMood.NATURE],
-                "budget_range": BudgetLevel.LUXURY
-            }
-        ]
-        
-        destinations = []
-        for data in destinations_data:
-            destination = Destination(**data)
-            destinations.append(destination)
-        
-        return destinations 
\ No newline at end of file
+    def generate_destinations() -> Tuple[Destination, ...]:
+        """Return the mock destination data (built once at import and shared)"""
+        return _DESTINATIONS
\ No newline at end of file
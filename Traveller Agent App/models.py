@@ -13,13 +13,21 @@ class TravelMood(Enum):
     URBAN = "urban"
     BEACH = "beach"
     MOUNTAINS = "mountains"
+    
+    @property
+    def bit(self) -> int:
+        """Single-bit flag for this mood, used to build and test mood masks"""
+        return _MOOD_BITS[self]
+
+# One bit per mood in declaration order, so any set of moods fits in one int
+_MOOD_BITS = {mood: 1 << i for i, mood in enumerate(TravelMood)}
 
 class BudgetLevel(Enum):
     BUDGET = "budget"
     MODERATE = "moderate"
     LUXURY = "luxury"
 
-@dataclass
+@dataclass(slots=True)
 class TravelRequest:
     """Represents a travel request from a user"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -33,7 +41,7 @@ class TravelRequest:
     special_requirements: List[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True)
 class Destination:
     """Represents a travel destination"""
     name: str
@@ -45,8 +53,24 @@ class Destination:
     mood_suitability: List[TravelMood] = field(default_factory=list)
     budget_range: BudgetLevel = BudgetLevel.MODERATE
     image_url: Optional[str] = None
+    # Lowercased copies used for preference matching, derived once in __post_init__
+    _name_lower: str = field(init=False, repr=False, compare=False)
+    _country_lower: str = field(init=False, repr=False, compare=False)
+    # Activities joined with a separator no requirement contains, so a single
+    # substring search matches within one activity only
+    _activities_blob: str = field(init=False, repr=False, compare=False)
+    # mood_suitability as a bitmask of TravelMood.bit flags
+    _mood_mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._name_lower = self.name.lower()
+        self._country_lower = self.country.lower()
+        self._activities_blob = " | ".join(activity.lower() for activity in self.activities)
+        self._mood_mask = 0
+        for mood in self.mood_suitability:
+            self._mood_mask |= mood.bit
 
-@dataclass
+@dataclass(slots=True)
 class Flight:
     """Represents a flight option"""
     airline: str
@@ -62,7 +86,7 @@ class Flight:
     cabin_class: str = "Economy"
     available_seats: int = 100
 
-@dataclass
+@dataclass(slots=True)
 class Hotel:
     """Represents a hotel option"""
     name: str
@@ -76,7 +100,7 @@ class Hotel:
     image_url: Optional[str] = None
     distance_from_center: str = "5 km"
 
-@dataclass
+@dataclass(slots=True)
 class Attraction:
     """Represents a tourist attraction"""
     name: str
@@ -90,7 +114,7 @@ class Attraction:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     tips: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Restaurant:
     """Represents a restaurant"""
     name: str
@@ -103,8 +127,25 @@ class Restaurant:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     specialties: List[str] = field(default_factory=list)
     reservation_required: bool = False
+    # Display string for the first three specialties, derived once in __post_init__
+    _top_specialties: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._top_specialties = ', '.join(self.specialties[:3])
+
+@dataclass(slots=True)
+class DayPlan:
+    """One day of an itinerary; empty slots are None"""
+    day: int
+    morning_activity: Optional[Attraction] = None
+    morning_restaurant: Optional[Restaurant] = None
+    afternoon_activity: Optional[Attraction] = None
+    afternoon_restaurant: Optional[Restaurant] = None
+    evening_activity: Optional[Attraction] = None
+    evening_restaurant: Optional[Restaurant] = None
+    tips: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class TravelPlan:
     """Complete travel plan with all components"""
     request: TravelRequest
@@ -118,7 +159,7 @@ class TravelPlan:
     created_at: datetime = field(default_factory=datetime.now)
     status: str = "draft"
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Standard response format for all agents"""
     success: bool
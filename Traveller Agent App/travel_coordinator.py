@@ -1,13 +1,21 @@
 import asyncio
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import contextlib
+import itertools
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, AsyncIterator, Union
 
 from base_agent import BaseAgent
+from config import Config
 from destination_agent import DestinationAgent
 from booking_agent import BookingAgent
 from explore_agent import ExploreAgent
 from models import TravelRequest, TravelPlan, AgentResponse, TravelMood, BudgetLevel
 
+# Static instruction for the final summary; the per-plan facts go in a compact prompt
+_SUMMARY_INSTRUCTION = ("Write an exciting, personalized 3-sentence summary of this trip, "
+                        "highlighting what makes the destination special for the travel style.")
+
 class TravelCoordinator(BaseAgent):
     """Main coordinator that orchestrates the travel planning workflow"""
     
@@ -21,6 +29,11 @@ class TravelCoordinator(BaseAgent):
         self.destination_agent = DestinationAgent()
         self.booking_agent = BookingAgent()
         self.explore_agent = ExploreAgent()
+        # Registry of specialized agents by name
+        self.agents: Dict[str, BaseAgent] = {
+            agent.name: agent
+            for agent in (self.destination_agent, self.booking_agent, self.explore_agent)
+        }
         
         # Add coordination tools
         self.add_tool({
@@ -43,13 +56,39 @@ class TravelCoordinator(BaseAgent):
             }
         })
         
-        # Track planning sessions
-        self.active_sessions = {}
+        # Track planning sessions, least recently used first
+        self.active_sessions: Dict[str, Dict[str, Any]] = OrderedDict()
+        # Number of sessions whose status is "completed", kept in step by _set_session_status
+        self._completed_count = 0
+        # Sequence numbers for session ids
+        self._session_counter = itertools.count(1)
     
     async def process_request(self, request: TravelRequest) -> AgentResponse:
         """Process a complete travel planning request"""
+        # aclosing finalizes the generator as soon as the response is returned
+        async with contextlib.aclosing(self._plan(request, stream=False)) as plan:
+            async for item in plan:
+                if isinstance(item, AgentResponse):
+                    return item
+        raise RuntimeError("Travel planning finished without a response")
+    
+    async def stream_progress(self, request: TravelRequest) -> AsyncIterator[Union[str, AgentResponse]]:
+        """Plan a trip like process_request, yielding output as soon as it is available.
+        
+        Each agent's section is yielded as text once that agent finishes and the
+        final summary is streamed from Gemini chunk by chunk. The last item is the
+        same AgentResponse that process_request would return; the session id is
+        only in its data, not in the streamed text.
+        """
+        async for item in self._plan(request, stream=True):
+            yield item
+    
+    async def _plan(self, request: TravelRequest, stream: bool) -> AsyncIterator[Union[str, AgentResponse]]:
+        """Run the planning workflow; text chunks are only yielded when streaming"""
         try:
-            session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            # Counter plus random suffix, so requests in the same second never share an id
+            session_id = f"session_{next(self._session_counter):08d}_{uuid.uuid4().hex[:8]}"
+            self._evict_sessions(Config.MAX_TRACKED_SESSIONS - 1)
             self.active_sessions[session_id] = {
                 "request": request,
                 "status": "started",
@@ -62,18 +101,27 @@ class TravelCoordinator(BaseAgent):
             # Step 1: Destination Planning
             destination_response = await self._handoff_to_destination_agent(request, session_id)
             if not destination_response.success:
-                return destination_response
+                yield destination_response
+                return
+            if stream:
+                yield f"\n📍 Destination recommendations:\n\n{destination_response.message}"
             
-            # Step 2: Booking Planning
+            # Steps 2 & 3: Booking and Exploration Planning
+            # Both only depend on the chosen destination, so run them concurrently
             selected_destination = destination_response.data["recommendations"][0]["destination"]
-            booking_response = await self._handoff_to_booking_agent(request, selected_destination, session_id)
-            if not booking_response.success:
-                return booking_response
-            
-            # Step 3: Exploration Planning
-            explore_response = await self._handoff_to_explore_agent(request, selected_destination, session_id)
-            if not explore_response.success:
-                return explore_response
+            booking_response, explore_response = await asyncio.gather(
+                self._handoff_to_booking_agent(request, selected_destination, session_id),
+                self._handoff_to_explore_agent(request, selected_destination, session_id),
+                return_exceptions=True
+            )
+            for response in (booking_response, explore_response):
+                if isinstance(response, BaseException):
+                    raise response
+                if not response.success:
+                    yield response
+                    return
+            if stream:
+                yield f"\n\n{booking_response.message}\n\n{explore_response.message}\n\n"
             
             # Step 4: Create Complete Travel Plan
             travel_plan = await self._create_complete_plan(
@@ -81,13 +129,21 @@ class TravelCoordinator(BaseAgent):
             )
             
             # Update session
-            self.active_sessions[session_id]["status"] = "completed"
+            self._set_session_status(session_id, "completed")
             self.active_sessions[session_id]["results"]["final_plan"] = travel_plan
             
             # Generate final summary using Gemini
-            final_summary = await self._generate_final_summary(travel_plan)
+            if stream:
+                summary_parts = []
+                async for chunk in self.call_gemini_stream(self._final_summary_prompt(travel_plan), _SUMMARY_INSTRUCTION):
+                    summary_parts.append(chunk)
+                    yield chunk
+                final_summary = "".join(summary_parts)
+                yield "\n\n🎉 Your complete travel plan is ready!\n"
+            else:
+                final_summary = await self._generate_final_summary(travel_plan)
             
-            return self.create_response(
+            yield self.create_response(
                 success=True,
                 message=f"""
 🎉 Your complete travel plan is ready!
@@ -111,7 +167,7 @@ Session ID: {session_id}
             )
             
         except Exception as e:
-            return self.create_response(
+            yield self.create_response(
                 success=False,
                 message=f"Error in travel coordination: {str(e)}",
                 data=None
@@ -195,25 +251,18 @@ Session ID: {session_id}
     
     async def _generate_final_summary(self, travel_plan: TravelPlan) -> str:
         """Generate a final summary using Gemini"""
-        summary_prompt = f"""
-        Create a compelling final summary for this travel plan:
-        
-        Destination: {travel_plan.destination.name}, {travel_plan.destination.country}
-        Travel Style: {travel_plan.request.mood.value}
-        Budget: {travel_plan.request.budget.value}
-        Duration: {self._calculate_duration(travel_plan.request)} days
-        Total Cost: ${travel_plan.total_cost:.2f}
-        
-        Highlights:
-        - {len(travel_plan.flights)} flight options available
-        - {len(travel_plan.attractions)} attractions recommended
-        - {len(travel_plan.restaurants)} restaurants suggested
-        
-        Please create an exciting, personalized summary that makes the user excited about their trip.
-        Include key highlights and what makes this destination special for their travel style.
-        """
-        
-        return await self.call_gemini(summary_prompt)
+        return await self.call_gemini(self._final_summary_prompt(travel_plan), _SUMMARY_INSTRUCTION)
+    
+    def _final_summary_prompt(self, travel_plan: TravelPlan) -> str:
+        """Build the compact key=value Gemini prompt for the final plan summary"""
+        request = travel_plan.request
+        destination = travel_plan.destination
+        return (
+            f"dest={destination.name},{destination.country} mood={request.mood.value} "
+            f"budget={request.budget.value} days={self._calculate_duration(request)} "
+            f"cost={travel_plan.total_cost:.2f} flights={len(travel_plan.flights)} "
+            f"attractions={len(travel_plan.attractions)} restaurants={len(travel_plan.restaurants)}"
+        )
     
     def _calculate_duration(self, request: TravelRequest) -> int:
         """Calculate trip duration"""
@@ -230,6 +279,7 @@ Session ID: {session_id}
                 data=None
             )
         
+        self.active_sessions.move_to_end(session_id)
         session = self.active_sessions[session_id]
         return self.create_response(
             success=True,
@@ -246,6 +296,7 @@ Session ID: {session_id}
                 data=None
             )
         
+        self.active_sessions.move_to_end(session_id)
         session = self.active_sessions[session_id]
         
         # Apply modifications
@@ -258,7 +309,7 @@ Session ID: {session_id}
             if destination_response.success:
                 # Update session with new destination
                 session["results"]["destination"] = destination_response.data
-                session["status"] = "modified"
+                self._set_session_status(session_id, "modified")
         
         return self.create_response(
             success=True,
@@ -266,38 +317,46 @@ Session ID: {session_id}
             data=session
         )
     
+    def _evict_sessions(self, keep: int):
+        """Drop least recently used sessions until at most `keep` remain"""
+        while len(self.active_sessions) > keep:
+            _, session = self.active_sessions.popitem(last=False)
+            if session["status"] == "completed":
+                self._completed_count -= 1
+    
+    def _set_session_status(self, session_id: str, status: str):
+        """Update a session's status and the running count of completed sessions"""
+        session = self.active_sessions[session_id]
+        if session["status"] == "completed":
+            self._completed_count -= 1
+        if status == "completed":
+            self._completed_count += 1
+        session["status"] = status
+    
     def get_coordinator_stats(self) -> Dict[str, Any]:
         """Get coordinator statistics"""
         total_sessions = len(self.active_sessions)
-        completed_sessions = len([s for s in self.active_sessions.values() if s["status"] == "completed"])
+        completed_sessions = self._completed_count
         
         return {
             "total_sessions": total_sessions,
             "completed_sessions": completed_sessions,
             "active_sessions": total_sessions - completed_sessions,
             "success_rate": (completed_sessions / total_sessions * 100) if total_sessions > 0 else 0,
-            "agents_available": [
-                self.destination_agent.name,
-                self.booking_agent.name,
-                self.explore_agent.name
-            ]
+            "agents_available": list(self.agents)
         }
     
     async def emergency_handoff(self, agent_name: str, request_data: Dict[str, Any]) -> AgentResponse:
         """Emergency handoff to a specific agent"""
         try:
-            if agent_name == "DestinationAgent":
-                return await self.destination_agent.process_request(request_data)
-            elif agent_name == "BookingAgent":
-                return await self.booking_agent.process_request(request_data)
-            elif agent_name == "ExploreAgent":
-                return await self.explore_agent.process_request(request_data)
-            else:
+            agent = self.agents.get(agent_name)
+            if agent is None:
                 return self.create_response(
                     success=False,
                     message=f"Unknown agent: {agent_name}",
                     data=None
                 )
+            return await agent.process_request(request_data)
         except Exception as e:
             return self.create_response(
                 success=False,